@@ -15,6 +15,19 @@ LIBRARY_ITEMS_KEY: str = "watchly:library_items:{token}"
 PROFILE_KEY: str = "watchly:profile:{token}:{content_type}"
 WATCHED_SETS_KEY: str = "watchly:watched_sets:{token}:{content_type}"
 CATALOG_KEY: str = "watchly:catalog:{token}:{type}:{id}"
+TMDB_DETAILS_KEY: str = "watchly:tmdb:{media_type}:{tmdb_id}:{language}"
+TMDB_KEYWORD_NAME_KEY: str = "watchly:tmdb:keyword:{keyword_id}"
+GEMINI_TITLE_KEY: str = "watchly:gemini:title:{model}:{prompt_hash}"
+
+# shared TMDB details cache: a week for finished titles, a day for series still airing
+TMDB_DETAILS_TTL: int = 7 * 86400
+TMDB_DETAILS_AIRING_TTL: int = 86400
+# IDs TMDB answers 404 for are remembered briefly so bursts don't re-request them
+TMDB_DETAILS_MISS_TTL: int = 60
+# keyword names practically never change
+TMDB_KEYWORD_NAME_TTL: int = 30 * 86400
+# row titles depend only on the prompt, so identical axis combinations share one
+GEMINI_TITLE_TTL: int = 7 * 86400
 
 
 DISCOVER_ONLY_EXTRA: list[dict] = [{"name": "genre", "isRequired": True, "options": ["All"], "optionsLimit": 1}]
@@ -1,7 +1,18 @@
 from datetime import datetime, timezone
+from operator import itemgetter
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
+
+
+def _normalize_scores(scores: dict[Any, float]) -> dict[Any, float]:
+    """Scale scores into 0-1 by the max score (left as-is if there is no positive max)."""
+    if not scores:
+        return {}
+    max_score = max(scores.values())
+    if max_score <= 0:
+        return scores
+    return {k: v / max_score for k, v in scores.items()}
 
 
 class TasteProfile(BaseModel):
@@ -45,29 +56,48 @@ class TasteProfile(BaseModel):
 
         json_encoders = {datetime: lambda v: v.isoformat()}
 
+    # Score maps sorted by descending score, filled lazily by get_top_*. Code that mutates the
+    # *_scores dicts must call invalidate_rankings() (ProfileBuilder does after every step).
+    _ranked: dict[str, list[tuple[Any, float]]] = PrivateAttr(default_factory=dict)
+
+    def invalidate_rankings(self) -> None:
+        """Drop cached get_top_* orderings after the scores change."""
+        self._ranked.clear()
+
+    def _get_ranked(self, name: str, scores: dict[Any, float]) -> list[tuple[Any, float]]:
+        """Sort a score map once; later get_top_* calls with any limit just slice it."""
+        ranked = self._ranked.get(name)
+        if ranked is None:
+            ranked = self._ranked[name] = sorted(scores.items(), key=itemgetter(1), reverse=True)
+        return ranked
+
     def get_top_genres(self, limit: int = 5) -> list[tuple[int, float]]:
         """Get top N genres by score."""
-        return sorted(self.genre_scores.items(), key=lambda x: x[1], reverse=True)[:limit]
+        return self._get_ranked("genre_scores", self.genre_scores)[:limit]
 
     def get_top_keywords(self, limit: int = 5) -> list[tuple[int, float]]:
         """Get top N keywords by score."""
-        return sorted(self.keyword_scores.items(), key=lambda x: x[1], reverse=True)[:limit]
+        return self._get_ranked("keyword_scores", self.keyword_scores)[:limit]
 
     def get_top_eras(self, limit: int = 3) -> list[tuple[str, float]]:
         """Get top N eras by score."""
-        return sorted(self.era_scores.items(), key=lambda x: x[1], reverse=True)[:limit]
+        return self._get_ranked("era_scores", self.era_scores)[:limit]
 
     def get_top_countries(self, limit: int = 3) -> list[tuple[str, float]]:
         """Get top N countries by score."""
-        return sorted(self.country_scores.items(), key=lambda x: x[1], reverse=True)[:limit]
+        return self._get_ranked("country_scores", self.country_scores)[:limit]
+
+    def get_top_runtimes(self, limit: int = 3) -> list[tuple[str, float]]:
+        """Get top N runtime buckets by score."""
+        return self._get_ranked("runtime_bucket_scores", self.runtime_bucket_scores)[:limit]
 
     def get_top_directors(self, limit: int = 5) -> list[tuple[int, float]]:
         """Get top N directors by score."""
-        return sorted(self.director_scores.items(), key=lambda x: x[1], reverse=True)[:limit]
+        return self._get_ranked("director_scores", self.director_scores)[:limit]
 
     def get_top_cast(self, limit: int = 5) -> list[tuple[int, float]]:
         """Get top N cast members by score."""
-        return sorted(self.cast_scores.items(), key=lambda x: x[1], reverse=True)[:limit]
+        return self._get_ranked("cast_scores", self.cast_scores)[:limit]
 
     def get_top_creators(self, limit: int = 5) -> list[tuple[int, float]]:
         """
@@ -76,8 +106,10 @@ class TasteProfile(BaseModel):
         Runtime merge for convenience. Profile stores them separately.
         """
         # Merge directors and cast for combined ranking
-        all_creators = {**self.director_scores, **self.cast_scores}
-        return sorted(all_creators.items(), key=lambda x: x[1], reverse=True)[:limit]
+        ranked = self._ranked.get("creators")
+        if ranked is None:
+            ranked = self._get_ranked("creators", {**self.director_scores, **self.cast_scores})
+        return ranked[:limit]
 
     def normalize_for_ranking(self) -> dict[str, dict[Any, float]]:
         """
@@ -86,22 +118,13 @@ class TasteProfile(BaseModel):
         Returns normalized scores (0-1 range) for each feature type.
         Used only when generating recommendations, never during profile updates.
         """
-
-        def normalize_dict(scores: dict[Any, float]) -> dict[Any, float]:
-            if not scores:
-                return {}
-            max_score = max(scores.values()) if scores.values() else 1.0
-            if max_score <= 0:
-                return scores
-            return {k: v / max_score for k, v in scores.items()}
-
         return {
-            "genres": normalize_dict(self.genre_scores),
-            "keywords": normalize_dict(self.keyword_scores),
-            "eras": normalize_dict(self.era_scores),
-            "countries": normalize_dict(self.country_scores),
-            "directors": normalize_dict(self.director_scores),
-            "cast": normalize_dict(self.cast_scores),
-            "creators": normalize_dict({**self.director_scores, **self.cast_scores}),
-            "runtime_buckets": normalize_dict(self.runtime_bucket_scores),
+            "genres": _normalize_scores(self.genre_scores),
+            "keywords": _normalize_scores(self.keyword_scores),
+            "eras": _normalize_scores(self.era_scores),
+            "countries": _normalize_scores(self.country_scores),
+            "directors": _normalize_scores(self.director_scores),
+            "cast": _normalize_scores(self.cast_scores),
+            "creators": _normalize_scores({**self.director_scores, **self.cast_scores}),
+            "runtime_buckets": _normalize_scores(self.runtime_bucket_scores),
         }
@@ -1,4 +1,5 @@
 import asyncio
+import heapq
 import random
 from datetime import datetime, timezone
 from typing import Any
@@ -9,6 +10,7 @@ from app.core.constants import DISCOVER_ONLY_EXTRA
 from app.core.settings import CatalogConfig, UserSettings
 from app.services.interest_summary import interest_summary_service
 from app.services.profile.integration import ProfileIntegration
+from app.services.recommendation.scoring import RecommendationScoring
 from app.services.row_generator import RowGeneratorService
 from app.services.scoring import ScoringService
 from app.services.tmdb.service import get_tmdb_service
@@ -102,14 +104,13 @@ class DynamicCatalogService:
         strong_signal_items = loved_liked_items + added_items
         strong_signal_scored = [self.scoring_service.process_item(it) for it in strong_signal_items]
 
-        # For watched items, score them and sort by interest_score
+        # For watched items, score them and keep only the top ones by interest_score
         watched_scored = [self.scoring_service.process_item(it) for it in watched_items]
-        watched_scored.sort(key=lambda x: x.score, reverse=True)
 
         # Combine: all loved/liked/added + top watched items by score
         # Limit total to max_items
         remaining_slots = max(0, max_items - len(strong_signal_scored))
-        top_watched = watched_scored[:remaining_slots]
+        top_watched = heapq.nlargest(remaining_slots, watched_scored, key=lambda x: x.score)
 
         return strong_signal_scored + top_watched
 
@@ -141,6 +142,9 @@ class DynamicCatalogService:
         )
 
         # 3. Generate Rows
+        # Same user + day -> same sampled rows, so row IDs stay stable until the daily rotation
+        row_seed = RecommendationScoring.generate_rotation_seed(token)
+
         async def _generate_for_type(media_type: str, genres: list[int]):
             logger.info(f"[Theme Catalogs] _generate_for_type called for {media_type}")
 
@@ -179,7 +183,9 @@ class DynamicCatalogService:
                     logger.warning(f"Failed to save profile for {media_type}: {e}")
 
             try:
-                catalogs = await self.row_generator.generate_rows(profile, media_type, api_key=gemini_api_key)
+                catalogs = await self.row_generator.generate_rows(
+                    profile, media_type, api_key=gemini_api_key, seed=row_seed
+                )
                 return media_type, catalogs
             except Exception as e:
                 logger.error(f"Failed to generate thematic rows for {media_type}: {e}")
@@ -312,10 +318,11 @@ class DynamicCatalogService:
         last_loved = None  # Initialize for the watched check
         if loved_config and loved_config.enabled and is_type_enabled(loved_config, content_type):
             loved = [i for i in library_items.get("loved", []) if i.get("type") == content_type]
-            loved.sort(key=self._parse_item_last_watched, reverse=True)
+            # Only the 3 most recent are needed, no need to sort the whole list
+            recent_loved = heapq.nlargest(3, loved, key=self._parse_item_last_watched)
 
             # gather random last loved from last 3 items
-            last_loved = random.choice(loved[:3]) if loved else None
+            last_loved = random.choice(recent_loved) if recent_loved else None
             if last_loved:
                 label = loved_config.name if loved_config.name else "More like"
                 loved_config_display_at_home = getattr(loved_config, "display_at_home", True)
@@ -326,14 +333,14 @@ class DynamicCatalogService:
         # 2. Because you watched <Watched Item>
         if watched_config and watched_config.enabled and is_type_enabled(watched_config, content_type):
             watched = [i for i in library_items.get("watched", []) if i.get("type") == content_type]
-            watched.sort(key=self._parse_item_last_watched, reverse=True)
 
             # watched cannot be similar to loved
             if last_loved:
                 watched = [i for i in watched if i.get("_id") != last_loved.get("_id")]
 
             # gather random last watched from last 3 items
-            last_watched = random.choice(watched[:3]) if watched else None
+            recent_watched = heapq.nlargest(3, watched, key=self._parse_item_last_watched)
+            last_watched = random.choice(recent_watched) if recent_watched else None
 
             if last_watched:
                 label = watched_config.name if watched_config.name else "Because you watched"
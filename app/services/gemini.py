@@ -1,3 +1,5 @@
+import asyncio
+import hashlib
 import json
 
 from google import genai
@@ -5,25 +7,31 @@ from google.genai import types
 from loguru import logger
 
 from app.core.config import settings
+from app.core.constants import GEMINI_TITLE_KEY, GEMINI_TITLE_TTL
+from app.services.redis_service import redis_service
 
 FLASH_MODEL = "gemini-2.5-flash"
 
 
-class GeminiService:
-    def __init__(self, model: str = settings.DEFAULT_GEMINI_MODEL):
-        self.model = model
-        self.client = None
-        if api_key := settings.GEMINI_API_KEY:
-            try:
-                self.client = genai.Client(api_key=api_key)
-            except Exception as e:
-                logger.warning(f"Failed to initialize Gemini client: {e}")
-        else:
-            logger.warning("GEMINI_API_KEY not set. Gemini features will be disabled.")
-
-    @staticmethod
-    def get_prompt():
-        return """
+def _parse_title_list(text: str, count: int) -> list[str]:
+    """Parse a JSON array of `count` titles from model output ("" for entries that are not usable)."""
+    if not text:
+        return [""] * count
+    start, end = text.find("["), text.rfind("]") + 1
+    try:
+        titles = json.loads(text[start:end]) if 0 <= start < end else None
+    except ValueError:
+        titles = None
+    if not isinstance(titles, list):
+        logger.warning(f"Could not parse {count} titles from Gemini response: {text[:200]!r}")
+        return [""] * count
+    if len(titles) != count:
+        logger.warning(f"Expected {count} titles from Gemini, got {len(titles)}")
+        return [""] * count
+    return [title.strip() if isinstance(title, str) else "" for title in titles]
+
+
+TITLE_GUIDELINES = """
         You are a content catalog naming expert.
         Given filters like genre, keywords, countries, or years, generate natural,
         engaging catalog row titles that streaming platforms would use.
@@ -38,10 +46,34 @@ class GeminiService:
         Keep titles:
         - Short (2-5 words)
         - Natural and engaging
-        - Focused on what makes the content appealing
+        - Focused on what makes the content appealing"""
+
+
+class GeminiService:
+    def __init__(self, model: str = settings.DEFAULT_GEMINI_MODEL):
+        self.model = model
+        self.client = None
+        if api_key := settings.GEMINI_API_KEY:
+            try:
+                self.client = genai.Client(api_key=api_key)
+            except Exception as e:
+                logger.warning(f"Failed to initialize Gemini client: {e}")
+        else:
+            logger.warning("GEMINI_API_KEY not set. Gemini features will be disabled.")
+
+    @staticmethod
+    def get_prompt():
+        return TITLE_GUIDELINES + """
         - Only return a single best title and nothing else.
         """
 
+    @staticmethod
+    def get_batch_prompt():
+        return TITLE_GUIDELINES + """
+        You will be given several numbered rows. Return only a JSON array of strings with
+        one best title per row, in the same order, and nothing else.
+        """
+
     def _get_client(self, api_key: str | None = None) -> genai.Client | None:
         if api_key:
             try:
@@ -66,6 +98,60 @@ class GeminiService:
             logger.exception(f"Error generating title with Gemini: {e}")
             return ""
 
+    async def generate_batch_async(self, prompts: list[str]) -> list[str]:
+        """
+        Generate one title per prompt, in order, with a single request.
+
+        The model is asked for a JSON array in the prompt (the default model has no JSON
+        response mode); entries that cannot be parsed come back as "".
+        """
+        if not self.client:
+            return [""] * len(prompts)
+
+        numbered = "\n".join(f"{n}. {prompt}" for n, prompt in enumerate(prompts, start=1))
+        try:
+            response = await self.client.aio.models.generate_content(
+                model=self.model,
+                contents=self.get_batch_prompt() + "\n\n" + numbered,
+            )
+            return _parse_title_list(response.text.strip(), len(prompts))
+        except Exception as e:
+            logger.exception(f"Error generating batched titles with Gemini: {e}")
+            return [""] * len(prompts)
+
+    def _title_key(self, prompt: str) -> str:
+        prompt_hash = hashlib.sha1(prompt.encode("utf-8")).hexdigest()
+        return GEMINI_TITLE_KEY.format(model=self.model, prompt_hash=prompt_hash)
+
+    async def generate_titles_async(self, prompts: list[str]) -> list[str]:
+        """
+        Generate one title per prompt, in order, with as few Gemini requests as possible.
+
+        Titles are cached in Redis by prompt, so only uncached prompts are sent. Several
+        uncached prompts go out as one batch; rows the batch did not title are retried with
+        the single-title request. Titles that could not be generated come back as "".
+        """
+        keys = [self._title_key(prompt) for prompt in prompts]
+        titles = [title or "" for title in await redis_service.mget(keys)]
+        missing = [i for i, title in enumerate(titles) if not title]
+        if not missing:
+            return titles
+
+        if len(missing) > 1:
+            generated = await self.generate_batch_async([prompts[i] for i in missing])
+            for i, title in zip(missing, generated):
+                titles[i] = title
+
+        retry = [i for i in missing if not titles[i]]
+        if retry and self.client:
+            generated = await asyncio.gather(*(self.generate_content_async(prompts[i]) for i in retry))
+            for i, title in zip(retry, generated):
+                titles[i] = title
+
+        # Empty means Gemini failed or is disabled; let the next request retry
+        await asyncio.gather(*(redis_service.set(keys[i], titles[i], GEMINI_TITLE_TTL) for i in missing if titles[i]))
+        return titles
+
     async def generate_flash_content_async(self, prompt: str, system_instruction: str, api_key: str) -> str:
         client = self._get_client(api_key)
         if not client:
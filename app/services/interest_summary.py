@@ -45,8 +45,7 @@ class InterestSummaryService:
         if top_countries:
             parts.append(f"[Context] Preferred Countries: {', '.join(top_countries)}")
 
-        top_runtimes = sorted(profile.runtime_bucket_scores.items(), key=lambda x: x[1], reverse=True)
-        runtime_prefs = [bucket for bucket, _ in top_runtimes[:3]]
+        runtime_prefs = [bucket for bucket, _ in profile.get_top_runtimes(limit=3)]
         if runtime_prefs:
             parts.append(f"[Context] Runtime Preference: {', '.join(runtime_prefs)}")
 
@@ -132,11 +132,8 @@ class ManifestService:
         self, bundle: StremioBundle, auth_key: str, user_settings: UserSettings | None, token: str
     ) -> list[dict[str, Any]]:
         """Build dynamic catalogs for the manifest."""
-        # check if cached, if not, fetch and cache
-        library_items = await user_cache.get_library_items(token)
-        if not library_items:
-            library_items = await self._ensure_library_and_profiles_cached(bundle, auth_key, user_settings, token)
-            await user_cache.set_library_items(token, library_items)
+        # check if cached, if not, fetch and cache (a single cache read, and the fetch path caches it itself)
+        library_items = await self._ensure_library_and_profiles_cached(bundle, auth_key, user_settings, token)
 
         tmdb_key = resolve_tmdb_api_key(user_settings)
         dynamic_catalog_service = DynamicCatalogService(language=user_settings.language, tmdb_api_key=tmdb_key)
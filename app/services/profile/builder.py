@@ -1,6 +1,6 @@
 import asyncio
 import math
-from collections import defaultdict
+from collections import Counter
 from typing import Any
 
 from loguru import logger
@@ -63,14 +63,14 @@ class ProfileBuilder:
         profile = TasteProfile(content_type=content_type)
 
         # Track frequencies for optional frequency multiplier
-        feature_frequencies: dict[str, dict[Any, int]] = {
-            "genres": defaultdict(int),
-            "keywords": defaultdict(int),
-            "eras": defaultdict(int),
-            "countries": defaultdict(int),
-            "directors": defaultdict(int),
-            "cast": defaultdict(int),
-            "runtime_buckets": defaultdict(int),
+        feature_frequencies: dict[str, Counter] = {
+            "genres": Counter(),
+            "keywords": Counter(),
+            "eras": Counter(),
+            "countries": Counter(),
+            "directors": Counter(),
+            "cast": Counter(),
+            "runtime_buckets": Counter(),
         }
 
         # Track weighted average for episodes (series only)
@@ -171,7 +171,7 @@ class ProfileBuilder:
         features: dict[str, Any],
         evidence_weight: float,
         is_loved: bool,
-        frequencies: dict[str, dict[Any, int]] | None = None,
+        frequencies: dict[str, Counter] | None = None,
     ) -> None:
         """
         Accumulate features into profile (pure addition).
@@ -194,8 +194,8 @@ class ProfileBuilder:
                 position_weight = GENRE_POSITION_WEIGHTS[idx] if idx < len(GENRE_POSITION_WEIGHTS) else 0.1
                 weight = evidence_weight * FEATURE_WEIGHT_GENRE * position_weight
                 profile.genre_scores[genre_id] = profile.genre_scores.get(genre_id, 0.0) + weight
-                if frequencies is not None:
-                    frequencies["genres"][genre_id] += 1
+        if frequencies is not None:
+            frequencies["genres"].update(filter(None, genres))
 
         # Keywords
         keywords = features.get("keywords", [])
@@ -204,8 +204,8 @@ class ProfileBuilder:
             if keyword_id:
                 weight = evidence_weight * FEATURE_WEIGHT_KEYWORD
                 profile.keyword_scores[keyword_id] = profile.keyword_scores.get(keyword_id, 0.0) + weight
-                if frequencies is not None:
-                    frequencies["keywords"][keyword_id] += 1
+        if frequencies is not None:
+            frequencies["keywords"].update(filter(None, keywords))
 
         # Eras
         era = features.get("era")
@@ -216,12 +216,13 @@ class ProfileBuilder:
                 frequencies["eras"][era] += 1
 
         # Countries
-        for country_code in features.get("countries", []):
+        countries = features.get("countries", [])
+        for country_code in countries:
             if country_code:
                 weight = evidence_weight * FEATURE_WEIGHT_COUNTRY
                 profile.country_scores[country_code] = profile.country_scores.get(country_code, 0.0) + weight
-                if frequencies is not None:
-                    frequencies["countries"][country_code] += 1
+        if frequencies is not None:
+            frequencies["countries"].update(filter(None, countries))
 
         crew_list = features.get("crew", [])
         if isinstance(crew_list, list):
@@ -265,7 +266,9 @@ class ProfileBuilder:
             if frequencies is not None:
                 frequencies["runtime_buckets"][runtime_bucket] += 1
 
-    def _apply_frequency_multipliers(self, profile: TasteProfile, frequencies: dict[str, dict[Any, int]]) -> None:
+        profile.invalidate_rankings()
+
+    def _apply_frequency_multipliers(self, profile: TasteProfile, frequencies: dict[str, Counter]) -> None:
         """
         Apply optional frequency multipliers (subtle boost for repeated patterns).
 
@@ -303,6 +306,8 @@ class ProfileBuilder:
                 multiplier = FREQUENCY_MULTIPLIER_BASE + (math.log(freq) * FREQUENCY_MULTIPLIER_LOG_FACTOR)
                 profile.runtime_bucket_scores[runtime_bucket] *= multiplier
 
+        profile.invalidate_rankings()
+
     @staticmethod
     def _apply_caps(profile: TasteProfile) -> None:
         """
@@ -340,6 +345,8 @@ class ProfileBuilder:
             current_score = profile.runtime_bucket_scores[runtime_bucket]
             profile.runtime_bucket_scores[runtime_bucket] = min(current_score, CAP_RUNTIME)
 
+        profile.invalidate_rankings()
+
     async def update_profile_incrementally(
         self,
         existing_profile: TasteProfile,
@@ -420,3 +427,5 @@ class ProfileBuilder:
         ]:
             for key in score_dict:
                 score_dict[key] *= decay_factor
+
+        profile.invalidate_rankings()
@@ -64,6 +64,10 @@ RUNTIME_BUCKET_MEDIUM_MAX_SERIES: Final[int] = 60  # 30-60 min, > 60 is long
 RUNTIME_BUCKET_SHORT_MAX_MOVIE: Final[int] = 120  # < 120 min
 RUNTIME_BUCKET_MEDIUM_MAX_MOVIE: Final[int] = 180  # 120-180 min, > 180 is long
 
+# Era Buckets (ERA_BUCKETS[i] covers years before ERA_YEAR_BOUNDARIES[i]; last bucket is open-ended)
+ERA_YEAR_BOUNDARIES: Final[tuple[int, ...]] = (1970, 1980, 1990, 2000, 2010, 2020)
+ERA_BUCKETS: Final[tuple[str, ...]] = ("pre-1970s", "1970s", "1980s", "1990s", "2000s", "2010s", "2020s")
+
 # Profile Decay Settings
 PROFILE_DECAY_ENABLED: Final[bool] = True
 PROFILE_DECAY_FACTOR: Final[float] = 0.98  # 2% decay per update
@@ -111,8 +111,6 @@ class EvidenceCalculator:
         if not last_interaction and interaction_type == "added":
             # For added items, use mtime if available
             try:
-                from datetime import datetime
-
                 if item.item.mtime:
                     last_interaction = datetime.fromisoformat(item.item.mtime.replace("Z", "+00:00"))
             except Exception:
@@ -24,6 +24,22 @@ class ProfileIntegration:
         tmdb_service = get_tmdb_service(language=language, api_key=tmdb_api_key)
         vectorizer = ItemVectorizer(tmdb_service)
         self.builder = ProfileBuilder(vectorizer)
+        # Watched sets don't depend on content type, so reuse them across movie/series builds
+        self._watched_sets_source: dict | None = None
+        self._watched_sets: tuple[set[str], set[int]] = (set(), set())
+
+    async def _get_watched_sets(
+        self, library_items: dict, stremio_service: Any = None, auth_key: str | None = None
+    ) -> tuple[set[str], set[int]]:
+        """Get (watched_imdb, watched_tmdb), computing them once per library snapshot."""
+        if self._watched_sets_source is not library_items:
+            self._watched_sets = await RecommendationFiltering.get_exclusion_sets(
+                stremio_service, library_items, auth_key
+            )
+            self._watched_sets_source = library_items
+        watched_imdb, watched_tmdb = self._watched_sets
+        # Hand out copies: downstream services may extend the sets per request
+        return set(watched_imdb), set(watched_tmdb)
 
     async def build_profile_from_library(
         self,
@@ -45,10 +61,13 @@ class ProfileIntegration:
             Tuple of (profile, watched_tmdb, watched_imdb)
         """
         # Get watched sets
-        watched_imdb, watched_tmdb = await RecommendationFiltering.get_exclusion_sets(
-            stremio_service, library_items, auth_key
-        )
+        watched_imdb, watched_tmdb = await self._get_watched_sets(library_items, stremio_service, auth_key)
+
+        profile = await self._build_profile(library_items, content_type)
+        return profile, watched_tmdb, watched_imdb
 
+    async def _build_profile(self, library_items: dict, content_type: str) -> TasteProfile | None:
+        """Sample library items of the given type and build a fresh profile from them."""
         # Convert library items to ScoredItems
         all_items = (
             library_items.get("loved", [])
@@ -59,7 +78,7 @@ class ProfileIntegration:
         typed_items = [it for it in all_items if it.get("type") == content_type]
 
         if not typed_items:
-            return None, watched_tmdb, watched_imdb
+            return None
 
         # Sample items using SmartSampler (it expects raw library items dict)
         library_items_dict = {
@@ -71,9 +90,7 @@ class ProfileIntegration:
         sampled = self.sampler.sample_items(library_items_dict, content_type)
 
         # Build profile
-        profile = await self.builder.build_profile(sampled, content_type=content_type)
-
-        return profile, watched_tmdb, watched_imdb
+        return await self.builder.build_profile(sampled, content_type=content_type)
 
     async def build_profile_incremental(
         self,
@@ -97,9 +114,7 @@ class ProfileIntegration:
             Tuple of (profile, watched_tmdb, watched_imdb)
         """
         # Get watched sets
-        watched_imdb, watched_tmdb = await RecommendationFiltering.get_exclusion_sets(
-            stremio_service, library_items, auth_key
-        )
+        watched_imdb, watched_tmdb = await self._get_watched_sets(library_items, stremio_service, auth_key)
 
         # Convert library items to ScoredItems for change detection
         all_items = (
@@ -195,17 +210,16 @@ class ProfileIntegration:
         except Exception as e:
             logger.warning(f"[{token[:8]}...] Incremental update failed, falling back to full rebuild: {e}")
 
-        # Fallback to full rebuild
+        # Fallback to full rebuild (watched sets above are reused rather than recomputed)
         logger.debug(f"[{token[:8]}...] Using full rebuild")
-        profile_tuple = await self.build_profile_from_library(library_items, content_type, stremio_service, auth_key)
-        profile, _, _ = profile_tuple
+        profile = await self._build_profile(library_items, content_type)
 
         # Update library hash after successful build
         await user_cache.update_library_hash(token, content_type, typed_items)
 
         return profile, watched_tmdb, watched_imdb
 
-    async def get_genre_whitelist(
+    def get_genre_whitelist(
         self,
         profile: TasteProfile,
         content_type: str,
@@ -1,3 +1,4 @@
+from itertools import islice
 from typing import Any
 
 from app.models.scoring import ScoredItem
@@ -101,12 +102,14 @@ class SmartSampler:
         added_quota = int(max_items * 0.20)
         watched_quota = max_items - loved_quota - added_quota
 
-        # Add initial quotas
-        for pool, quota in [
+        pools_with_quotas = [
             (loved_liked_pool, loved_quota),
             (added_pool, added_quota),
             (watched_pool, watched_quota),
-        ]:
+        ]
+
+        # Add initial quotas
+        for pool, quota in pools_with_quotas:
             for scored in pool[:quota]:
                 final_scored_items.append(scored)
                 used_ids.add(scored.item.id)
@@ -115,8 +118,9 @@ class SmartSampler:
         remaining_slots = max_items - len(final_scored_items)
         if remaining_slots > 0:
             # Priority for backfill: Loved > Added > Watched
-            for pool in [loved_liked_pool, added_pool, watched_pool]:
-                for scored in pool:
+            # Each pool's first `quota` items were all taken above, so resume scanning after them
+            for pool, quota in pools_with_quotas:
+                for scored in islice(pool, quota, None):
                     if remaining_slots <= 0:
                         break
                     if scored.item.id not in used_ids:
@@ -1,7 +1,12 @@
+from bisect import bisect_right
+from collections.abc import Sequence
+from itertools import repeat
 from typing import Any
 
 from app.models.taste_profile import TasteProfile
 from app.services.profile.constants import (
+    ERA_BUCKETS,
+    ERA_YEAR_BOUNDARIES,
     FEATURE_WEIGHT_COUNTRY,
     FEATURE_WEIGHT_CREATOR,
     FEATURE_WEIGHT_ERA,
@@ -16,7 +21,11 @@ class ProfileScorer:
     """
 
     @staticmethod
-    def score_item(item_metadata: dict[str, Any], profile: TasteProfile) -> float:
+    def score_item(
+        item_metadata: dict[str, Any],
+        profile: TasteProfile,
+        normalized: dict[str, dict[Any, float]] | None = None,
+    ) -> float:
         """
         Score an item against the profile.
 
@@ -25,24 +34,25 @@ class ProfileScorer:
         Args:
             item_metadata: Item metadata dict with genres, keywords, year, countries, etc.
             profile: TasteProfile to score against
+            normalized: Optional pre-computed profile.normalize_for_ranking() output.
+                        Pass it when scoring many items against the same profile.
 
         Returns:
             Score (higher = better match)
         """
         # Normalize profile for ranking (read-time only)
-        normalized = profile.normalize_for_ranking()
+        if normalized is None:
+            normalized = profile.normalize_for_ranking()
 
         score = 0.0
 
         # Genre score (weighted average of matching genres)
-        item_genres = item_metadata.get("genre_ids", [])
+        item_genres = item_metadata.get("genre_ids", ())
         if item_genres:
-            genre_matches = [normalized["genres"].get(gid, 0.0) for gid in item_genres]
-            genre_score = sum(genre_matches) / len(genre_matches) if genre_matches else 0.0
-            score += genre_score * FEATURE_WEIGHT_GENRE
+            score += ProfileScorer._mean_weight(normalized["genres"], item_genres) * FEATURE_WEIGHT_GENRE
 
         # Keyword score (weighted average of matching keywords)
-        item_keywords = item_metadata.get("keyword_ids", [])
+        item_keywords = item_metadata.get("keyword_ids", ())
         if not item_keywords:
             # Try to extract from keywords dict
             keywords = item_metadata.get("keywords", {})
@@ -50,23 +60,17 @@ class ProfileScorer:
                 item_keywords = [k.get("id") for k in keywords.get("keywords", []) if k.get("id")]
 
         if item_keywords:
-            keyword_matches = [normalized["keywords"].get(kid, 0.0) for kid in item_keywords]
-            keyword_score = sum(keyword_matches) / len(keyword_matches) if keyword_matches else 0.0
-            score += keyword_score * FEATURE_WEIGHT_KEYWORD
+            score += ProfileScorer._mean_weight(normalized["keywords"], item_keywords) * FEATURE_WEIGHT_KEYWORD
 
         # Cast score (weighted average of matching cast)
         item_cast = ProfileScorer._extract_cast_ids(item_metadata)
         if item_cast:
-            cast_matches = [normalized["cast"].get(cid, 0.0) for cid in item_cast]
-            cast_score = sum(cast_matches) / len(cast_matches) if cast_matches else 0.0
-            score += cast_score * FEATURE_WEIGHT_CREATOR
+            score += ProfileScorer._mean_weight(normalized["cast"], item_cast) * FEATURE_WEIGHT_CREATOR
 
         # Director score (weighted average of matching directors)
         item_directors = ProfileScorer._extract_director_ids(item_metadata)
         if item_directors:
-            director_matches = [normalized["directors"].get(did, 0.0) for did in item_directors]
-            director_score = sum(director_matches) / len(director_matches) if director_matches else 0.0
-            score += director_score * FEATURE_WEIGHT_CREATOR
+            score += ProfileScorer._mean_weight(normalized["directors"], item_directors) * FEATURE_WEIGHT_CREATOR
 
         # Era score
         year = item_metadata.get("release_date") or item_metadata.get("first_air_date")
@@ -82,18 +86,21 @@ class ProfileScorer:
         # Country score (weighted average of matching countries)
         item_countries = ProfileScorer._extract_country_codes(item_metadata)
         if item_countries:
-            country_matches = [normalized["countries"].get(cc, 0.0) for cc in item_countries]
-            country_score = sum(country_matches) / len(country_matches) if country_matches else 0.0
-            score += country_score * FEATURE_WEIGHT_COUNTRY
+            score += ProfileScorer._mean_weight(normalized["countries"], item_countries) * FEATURE_WEIGHT_COUNTRY
 
         return score
 
+    @staticmethod
+    def _mean_weight(weights: dict[Any, float], ids: Sequence[Any]) -> float:
+        """Average profile weight over the given feature IDs (missing IDs count as 0)."""
+        return sum(map(weights.get, ids, repeat(0.0, len(ids)))) / len(ids)
+
     @staticmethod
     def _extract_cast_ids(item_metadata: dict[str, Any]) -> list[int]:
         """Extract cast IDs from item metadata."""
         cast_ids = []
         credits = item_metadata.get("credits", {}) or {}
-        cast_list = credits.get("cast", []) or []
+        cast_list = credits.get("cast") or ()
         for actor in cast_list[:5]:  # Top 5 only
             if isinstance(actor, dict):
                 actor_id = actor.get("id")
@@ -106,7 +113,7 @@ class ProfileScorer:
         """Extract director IDs from item metadata."""
         director_ids = []
         credits = item_metadata.get("credits", {}) or {}
-        crew_list = credits.get("crew", []) or []
+        crew_list = credits.get("crew") or ()
         for crew_member in crew_list:
             if (
                 isinstance(crew_member, dict)
@@ -122,7 +129,7 @@ class ProfileScorer:
     def _extract_country_codes(item_metadata: dict[str, Any]) -> list[str]:
         """Extract country codes from item metadata."""
         countries = []
-        production_countries = item_metadata.get("production_countries", []) or []
+        production_countries = item_metadata.get("production_countries") or ()
         for country in production_countries:
             if isinstance(country, dict):
                 country_code = country.get("iso_3166_1")
@@ -135,17 +142,4 @@ class ProfileScorer:
     @staticmethod
     def _year_to_era(year: int) -> str:
         """Convert year to era bucket."""
-        if year < 1970:
-            return "pre-1970s"
-        elif year < 1980:
-            return "1970s"
-        elif year < 1990:
-            return "1980s"
-        elif year < 2000:
-            return "1990s"
-        elif year < 2010:
-            return "2000s"
-        elif year < 2020:
-            return "2010s"
-        else:
-            return "2020s"
+        return ERA_BUCKETS[bisect_right(ERA_YEAR_BOUNDARIES, year)]
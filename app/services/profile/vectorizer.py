@@ -1,12 +1,16 @@
+from bisect import bisect_right
 from typing import Any
 
 import httpx
+from loguru import logger
 
 from app.models.scoring import ScoredItem
 from app.services.cinemeta_service import CinemetaService, cinemeta_service
 from app.services.profile.constants import (
     CAST_POSITION_LEAD,
     CAST_POSITION_MINOR,
+    ERA_BUCKETS,
+    ERA_YEAR_BOUNDARIES,
     RUNTIME_BUCKET_MEDIUM_MAX_MOVIE,
     RUNTIME_BUCKET_MEDIUM_MAX_SERIES,
     RUNTIME_BUCKET_SHORT_MAX_MOVIE,
@@ -135,16 +139,12 @@ class ItemVectorizer:
             return await self._transform_vector(vector, metadata, item.item.type)
 
         except httpx.HTTPStatusError as e:
-            from loguru import logger
-
             if e.response.status_code == 404:
                 logger.debug(f"TMDB not found ({e.response.status_code}) for item {item.item.id}, skipping")
             else:
                 logger.warning(f"TMDB error {e.response.status_code} for item {item.item.id}: {e}")
             return None
         except Exception as e:
-            from loguru import logger
-
             logger.exception(f"Failed to extract features from item {item.item.id}: {e}")
             return None
 
@@ -179,7 +179,7 @@ class ItemVectorizer:
         cinemeta_metadata = await self.cinemeta_service.get_metadata(imdb_id, content_type)
 
         # Extract runtime bucket
-        runtime_bucket = await self._extract_runtime_bucket(cinemeta_metadata)
+        runtime_bucket = self._extract_runtime_bucket(cinemeta_metadata)
         if runtime_bucket:
             features["runtime_bucket"] = runtime_bucket
 
@@ -272,7 +272,7 @@ class ItemVectorizer:
 
         return crew_list
 
-    async def _extract_runtime_bucket(self, cinemeta_metadata: dict[str, Any]) -> str | None:
+    def _extract_runtime_bucket(self, cinemeta_metadata: dict[str, Any]) -> str | None:
         """
         Extract runtime and convert to bucket.
 
@@ -334,20 +334,7 @@ class ItemVectorizer:
         Returns:
             Era bucket string (e.g., "1990s", "2010s")
         """
-        if year < 1970:
-            return "pre-1970s"
-        elif year < 1980:
-            return "1970s"
-        elif year < 1990:
-            return "1980s"
-        elif year < 2000:
-            return "1990s"
-        elif year < 2010:
-            return "2000s"
-        elif year < 2020:
-            return "2010s"
-        else:
-            return "2020s"
+        return ERA_BUCKETS[bisect_right(ERA_YEAR_BOUNDARIES, year)]
 
     async def _resolve_tmdb_id(self, stremio_id: str) -> int | None:
         """
@@ -1,8 +1,10 @@
 import asyncio
+from operator import itemgetter
 from typing import Any
 
 from loguru import logger
 
+from app.core.constants import MAX_CATALOG_ITEMS
 from app.core.settings import UserSettings
 from app.models.taste_profile import TasteProfile
 from app.services.profile.scorer import ProfileScorer
@@ -13,7 +15,7 @@ from app.services.recommendation.utils import (
     content_type_to_mtype,
     filter_by_genres,
     filter_items_by_settings,
-    filter_watched_by_imdb,
+    is_watched_by_imdb,
     resolve_tmdb_id,
 )
 from app.services.simkl import simkl_service
@@ -92,10 +94,7 @@ class AllBasedService:
         if simkl_api_key:
             simkl_candidates = await self._fetch_simkl_candidates(top_items, mtype)
             if simkl_candidates:
-                for candidate in simkl_candidates:
-                    candidate_id = candidate.get("id")
-                    if candidate_id:
-                        all_candidates[candidate_id] = candidate
+                all_candidates = {candidate["id"]: candidate for candidate in simkl_candidates if candidate.get("id")}
                 logger.info(f"Fetched {len(all_candidates)} candidates from Simkl")
                 # filter simkl candidates
                 simkl_candidates = list(all_candidates.values())
@@ -116,16 +115,14 @@ class AllBasedService:
                     continue
                 tasks.append(self._fetch_recommendations_for_item(item_id, mtype))
 
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            for res in results:
-                if isinstance(res, Exception):
-                    logger.debug(f"Error fetching recommendations: {res}")
+            # Merge each source as soon as it returns instead of waiting for the slowest one
+            for fut in asyncio.as_completed(tasks):
+                try:
+                    res = await fut
+                except Exception as e:
+                    logger.debug(f"Error fetching recommendations: {e}")
                     continue
-                for candidate in res:
-                    candidate_id = candidate.get("id")
-                    if candidate_id:
-                        all_candidates[candidate_id] = candidate
+                all_candidates |= {candidate["id"]: candidate for candidate in res if candidate.get("id")}
 
             logger.info(f"Fetched {len(all_candidates)} candidates from TMDB")
 
@@ -148,28 +145,18 @@ class AllBasedService:
         scored = []
         if profile:
             rotation_seed = RecommendationScoring.generate_rotation_seed()  # Daily rotation for fresh recommendations
-            for item in filtered:
-                try:
-                    final_score = RecommendationScoring.calculate_final_score(
-                        item=item,
-                        profile=profile,
-                        scorer=self.scorer,
-                        mtype=mtype,
-                        rotation_seed=rotation_seed,
-                    )
-
-                    # Apply genre multiplier (if whitelist available)
-                    genre_mult = RecommendationFiltering.get_genre_multiplier(item.get("genre_ids"), whitelist)
-                    final_score *= genre_mult
-
-                    scored.append((final_score, item))
-                except Exception as e:
-                    logger.debug(f"Failed to score item {item.get('id')}: {e}")
-                    continue
+            scored = RecommendationScoring.score_candidates(
+                filtered, profile, self.scorer, mtype, rotation_seed=rotation_seed
+            )
+
+            # Apply genre multiplier (if whitelist available)
+            if whitelist:
+                get_genre_multiplier = RecommendationFiltering.get_genre_multiplier
+                scored = [
+                    (score * get_genre_multiplier(item.get("genre_ids"), whitelist), item) for score, item in scored
+                ]
 
-            # Sort by score
-            scored.sort(key=lambda x: x[0], reverse=True)
-            filtered = [item for _, item in scored]
+            filtered = [item for _, item in sorted(scored, key=itemgetter(0), reverse=True)]
         else:
             # No profile - just use filtered items sorted by popularity/rating
             logger.info("No profile available, sorting by popularity")
@@ -177,15 +164,18 @@ class AllBasedService:
 
         logger.info(f"Scored {len(scored) if scored else len(filtered)} candidates")
 
-        # Enrich metadata
-        enriched = await RecommendationMetadata.fetch_batch(
-            self.tmdb_service, filtered, content_type, user_settings=self.user_settings
+        # Enrich in rank order, skipping items watched by IMDB ID, until the catalog is full; items dropped
+        # along the way (no IMDB ID, user settings, watched) are backfilled from further down the ranking
+        final = await RecommendationMetadata.fetch_batch(
+            self.tmdb_service,
+            filtered,
+            content_type,
+            user_settings=self.user_settings,
+            target=MAX_CATALOG_ITEMS,
+            keep=lambda meta: not is_watched_by_imdb(meta, watched_imdb),
         )
 
-        logger.info(f"Enriched {len(enriched)} items")
-
-        # Final filter (remove watched by IMDB ID)
-        final = filter_watched_by_imdb(enriched, watched_imdb)
+        logger.info(f"Enriched {len(final)} items")
 
         # Return top N
         return final
@@ -242,23 +232,18 @@ class AllBasedService:
             mtype: Media type (movie/tv)
 
         Returns:
-            List of candidate items
+            List of candidate items (not deduplicated; the caller merges by ID)
         """
         # Resolve TMDB ID
         tmdb_id = await resolve_tmdb_id(item_id, self.tmdb_service)
         if not tmdb_id:
             return []
 
-        combined = {}
-
         # Fetch 1 page each for recommendations
         try:
             res = await self.tmdb_service.get_recommendations(tmdb_id, mtype, page=1)
-            for item in res.get("results", []):
-                candidate_id = item.get("id")
-                if candidate_id:
-                    combined[candidate_id] = item
         except Exception as e:
             logger.debug(f"Error fetching recommendations for {tmdb_id}: {e}")
+            return []
 
-        return list(combined.values())
+        return res.get("results", [])
@@ -1,6 +1,8 @@
+import asyncio
 import random
 import re
 import time
+import weakref
 from typing import Any
 
 from fastapi import HTTPException
@@ -39,12 +41,8 @@ def shuffle_data_if_needed(
     return data
 
 
-def _clean_meta(meta: dict) -> dict | None:
-    """Return a sanitized Stremio meta object without internal fields.
-
-    Keeps only public keys and drops internal scoring/IDs/keywords/cast, etc.
-    """
-    allowed = {
+_PUBLIC_META_KEYS = frozenset(
+    {
         "id",
         "type",
         "name",
@@ -57,9 +55,17 @@ def _clean_meta(meta: dict) -> dict | None:
         "genres",
         "runtime",
     }
-    cleaned = {k: v for k, v in meta.items() if k in allowed}
-    # Drop empty values
-    cleaned = {k: v for k, v in cleaned.items() if v not in (None, "", [], {}, ())}
+)
+_EMPTY_META_VALUES = (None, "", [], {}, ())
+
+
+def _clean_meta(meta: dict) -> dict | None:
+    """Return a sanitized Stremio meta object without internal fields.
+
+    Keeps only public keys and drops internal scoring/IDs/keywords/cast, etc.
+    """
+    # Single projection: keep public keys with non-empty values
+    cleaned = {k: v for k, v in meta.items() if k in _PUBLIC_META_KEYS and v not in _EMPTY_META_VALUES}
 
     # Normalize IMDb rating to a string with 1 decimal place
     rating = cleaned.get("imdbRating")
@@ -82,7 +88,8 @@ def _clean_meta(meta: dict) -> dict | None:
 
 class CatalogService:
     def __init__(self):
-        pass
+        # Per-user locks so concurrent catalog requests share a single library fetch
+        self._library_locks: weakref.WeakValueDictionary[str, asyncio.Lock] = weakref.WeakValueDictionary()
 
     async def get_catalog(
         self, token: str, content_type: str, catalog_id: str
@@ -173,24 +180,15 @@ class CatalogService:
 
             language = user_settings.language if user_settings else "en-US"
 
-            # Try to get cached library items first
-            library_items = await user_cache.get_library_items(token)
-
-            if library_items:
-                logger.debug(f"[{redact_token(token)}...] Using cached library items")
-            else:
-                # Fetch library if not cached
-                logger.info(f"[{redact_token(token)}...] Library items not cached, fetching from Stremio")
-                library_items = await bundle.library.get_library_items(auth_key)
-                # Cache it for future use
-                await user_cache.set_library_items(token, library_items)
+            # Library items and the cached profile/watched sets are independent reads, so fetch them together
+            library_items, cached_data = await asyncio.gather(
+                self._get_library_items(bundle, auth_key, token),
+                user_cache.get_profile_and_watched_sets(token, content_type),
+            )
 
             services = self._initialize_services(language, user_settings)
             integration_service: ProfileIntegration = services["integration"]
 
-            # Try to get cached profile and watched sets
-            cached_data = await user_cache.get_profile_and_watched_sets(token, content_type)
-
             if cached_data:
                 # Use cached profile and watched sets
                 profile, watched_tmdb, watched_imdb = cached_data
@@ -211,7 +209,7 @@ class CatalogService:
                     auth_key,
                 )
 
-            whitelist = await integration_service.get_genre_whitelist(profile, content_type) if profile else set()
+            whitelist = integration_service.get_genre_whitelist(profile, content_type) if profile else set()
 
             # Route to appropriate recommendation service
             recommendations = await self._get_recommendations(
@@ -337,6 +335,32 @@ class CatalogService:
 
         return auth_key
 
+    async def _get_library_items(self, bundle: StremioBundle, auth_key: str, token: str) -> dict[str, Any]:
+        """Get library items from cache, fetching from Stremio at most once across concurrent requests."""
+        # Try to get cached library items first
+        library_items = await user_cache.get_library_items(token)
+        if library_items:
+            logger.debug(f"[{redact_token(token)}...] Using cached library items")
+            return library_items
+
+        lock = self._library_locks.get(token)
+        if lock is None:
+            lock = self._library_locks[token] = asyncio.Lock()
+
+        async with lock:
+            # Another request for this user may have filled the cache while we waited
+            library_items = await user_cache.get_library_items(token)
+            if library_items:
+                logger.debug(f"[{redact_token(token)}...] Using cached library items")
+                return library_items
+
+            # Fetch library if not cached
+            logger.info(f"[{redact_token(token)}...] Library items not cached, fetching from Stremio")
+            library_items = await bundle.library.get_library_items(auth_key)
+            # Cache it for future use
+            await user_cache.set_library_items(token, library_items)
+            return library_items
+
     def _extract_settings(self, credentials: dict) -> UserSettings:
         settings_dict = credentials.get("settings", {})
         return UserSettings(**settings_dict) if settings_dict else get_default_settings()
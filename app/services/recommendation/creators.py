@@ -60,7 +60,6 @@ class CreatorsService:
             raise HTTPException(status_code=404, detail="No top directors or cast found")
 
         # Fetch recommendations from creators
-        all_candidates = {}
         tasks = []
 
         # Create tasks for directors (fetch 2 pages each)
@@ -94,14 +93,14 @@ class CreatorsService:
         # Execute all tasks in parallel
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
-        # Collect results
-        for result in results:
-            if isinstance(result, Exception):
-                continue
-            for item in result:
-                item_id = item.get("id")
-                if item_id:
-                    all_candidates[item_id] = item
+        # Collect results (deduped by TMDB ID, later pages override earlier ones)
+        all_candidates = {
+            item["id"]: item
+            for result in results
+            if not isinstance(result, Exception)
+            for item in result
+            if item.get("id")
+        }
 
         # Filter candidates
         excluded_ids = RecommendationFiltering.get_excluded_genre_ids(self.user_settings, content_type)
@@ -113,10 +112,10 @@ class CreatorsService:
                 continue
 
             # Genre whitelist check
-            genre_ids = item.get("genre_ids", [])
+            genre_ids = item.get("genre_ids", ())
 
             # Excluded genres check
-            if excluded_ids and any(gid in excluded_ids for gid in genre_ids):
+            if excluded_ids and not excluded_ids.isdisjoint(genre_ids):
                 continue
 
             filtered.append(item)
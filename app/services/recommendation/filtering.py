@@ -1,33 +1,57 @@
+import asyncio
+import functools
+import re
+from itertools import chain
 from typing import Any
 from urllib.parse import unquote
 
+# Library buckets whose items are excluded from recommendations
+_EXCLUSION_LIBRARY_KEYS = ("loved", "watched", "removed", "liked")
+# Above this many library items, exclusion sets are built off the event loop
+_EXCLUSION_THREAD_THRESHOLD = 2000
+
+# One comma-separated token of a Stremio identifier: a "tt..." IMDb ID or a "tmdb:<digits>" TMDB ID
+_ID_TOKEN_RE = re.compile(r"(?:^|,)\s*(?:(tt[^,]*?)|tmdb:\s*([+-]?\d+))\s*(?=,|$)")
+
 
 def parse_identifier(identifier: str) -> tuple[str | None, int | None]:
     """Parse Stremio identifier to extract IMDB ID and TMDB ID."""
     if not identifier:
         return None, None
 
-    decoded = unquote(identifier)
+    # Fast path: most library IDs are a single plain "tt..." or "tmdb:..." token
+    if "," not in identifier and "%" not in identifier and not identifier[-1].isspace():
+        if identifier.startswith("tt"):
+            return identifier, None
+        if identifier.startswith("tmdb:"):
+            try:
+                return None, int(identifier[5:])
+            except ValueError:
+                pass
+
+    decoded = unquote(identifier) if "%" in identifier else identifier
     imdb_id: str | None = None
     tmdb_id: int | None = None
 
-    for token in decoded.split(","):
-        token = token.strip()
-        if not token:
-            continue
-        if token.startswith("tt") and imdb_id is None:
-            imdb_id = token
-        elif token.startswith("tmdb:") and tmdb_id is None:
-            try:
-                tmdb_id = int(token.split(":", 1)[1])
-            except (ValueError, IndexError):
-                continue
+    for match in _ID_TOKEN_RE.finditer(decoded):
+        imdb_token, tmdb_token = match.groups()
+        if imdb_token is not None:
+            if imdb_id is None:
+                imdb_id = imdb_token
+        elif tmdb_id is None:
+            tmdb_id = int(tmdb_token)
         if imdb_id and tmdb_id is not None:
             break
 
     return imdb_id, tmdb_id
 
 
+@functools.lru_cache(maxsize=256)
+def _parse_genre_ids(genres: tuple[str | int, ...]) -> frozenset[int]:
+    """Parse excluded genre settings into int IDs (memoized: the same few settings recur on every request)."""
+    return frozenset(int(g) for g in genres)
+
+
 class RecommendationFiltering:
     """
     Handles exclusion sets, genre whitelists, and item filtering.
@@ -49,16 +73,23 @@ class RecommendationFiltering:
 
         library_data = library_data or {}
 
-        all_items = (
-            library_data.get("loved", [])
-            + library_data.get("watched", [])
-            + library_data.get("removed", [])
-            + library_data.get("liked", [])
-        )
+        # Large libraries take long enough to walk that they'd stall other requests on the event loop
+        item_count = sum(len(library_data.get(key) or ()) for key in _EXCLUSION_LIBRARY_KEYS)
+        if item_count > _EXCLUSION_THREAD_THRESHOLD:
+            return await asyncio.to_thread(RecommendationFiltering.build_exclusion_sets, library_data)
+        return RecommendationFiltering.build_exclusion_sets(library_data)
 
-        imdb_ids = set()
-        tmdb_ids = set()
+    @staticmethod
+    def build_exclusion_sets(library_data: dict) -> tuple[set[str], set[int]]:
+        """
+        Build (imdb_ids, tmdb_ids) exclusion sets from already-fetched library items.
+        """
+        imdb_ids: set[str] = set()
+        tmdb_ids: set[int] = set()
+        add_imdb = imdb_ids.add
+        add_tmdb = tmdb_ids.add
 
+        all_items = chain.from_iterable(library_data.get(key) or () for key in _EXCLUSION_LIBRARY_KEYS)
         for item in all_items:
             item_id = item.get("_id", "")
             if not item_id:
@@ -67,20 +98,20 @@ class RecommendationFiltering:
             imdb_id, tmdb_id = parse_identifier(item_id)
 
             if imdb_id:
-                imdb_ids.add(imdb_id)
+                add_imdb(imdb_id)
             if tmdb_id:
-                tmdb_ids.add(tmdb_id)
+                add_tmdb(tmdb_id)
 
-            # Fallback parsing for common Stremio/Watchly patterns
+            # Fallback parsing for episode-style IDs (tt123:1:1, tmdb:123:1), which parse_identifier
+            # keeps whole or rejects
+            if ":" not in item_id:
+                continue
             if item_id.startswith("tt"):
-                # Handle tt123 and tt123:1:1
-                base_imdb = item_id.split(":")[0]
-                imdb_ids.add(base_imdb)
+                add_imdb(item_id.split(":", 1)[0])
             elif item_id.startswith("tmdb:"):
                 try:
-                    tid = int(item_id.split(":")[1])
-                    tmdb_ids.add(tid)
-                except Exception:
+                    add_tmdb(int(item_id.split(":")[1]))
+                except ValueError:
                     pass
 
         return imdb_ids, tmdb_ids
@@ -97,11 +128,12 @@ class RecommendationFiltering:
         for item in candidates:
             tid = item.get("id")
             # 1. Check TMDB ID (integer)
-            if tid and isinstance(tid, int) and tid in watched_tmdb:
-                continue
+            if isinstance(tid, int):
+                if tid in watched_tmdb:
+                    continue
 
             # 2. Check Stremio ID (string) if present as 'id'
-            if tid and isinstance(tid, str):
+            elif tid and isinstance(tid, str):
                 if tid in watched_imdb:
                     continue
                 if tid.startswith("tmdb:"):
@@ -112,17 +144,19 @@ class RecommendationFiltering:
                         pass
 
             # 3. Check External IDs
-            ext = item.get("external_ids", {}) or item.get("_external_ids", {})
-            imdb = ext.get("imdb_id")
-            if imdb and imdb in watched_imdb:
-                continue
-
-            # 4. Handle cases where TMDB ID is in 'id' but it's a string
-            try:
-                if tid and int(tid) in watched_tmdb:
+            ext = item.get("external_ids") or item.get("_external_ids")
+            if ext:
+                imdb = ext.get("imdb_id")
+                if imdb and imdb in watched_imdb:
                     continue
-            except Exception:
-                pass
+
+            # 4. Handle cases where TMDB ID is in 'id' but it's a string (ints were handled above)
+            if tid and not isinstance(tid, int):
+                try:
+                    if int(tid) in watched_tmdb:
+                        continue
+                except Exception:
+                    pass
 
             filtered.append(item)
         return filtered
@@ -163,15 +197,15 @@ class RecommendationFiltering:
         return "popularity.desc"
 
     @staticmethod
-    def get_excluded_genre_ids(user_settings: Any, content_type: str) -> list[int]:
-        """Get genre IDs to exclude based on user settings."""
+    def get_excluded_genre_ids(user_settings: Any, content_type: str) -> frozenset[int]:
+        """Get genre IDs to exclude based on user settings (as a set, ready for membership checks)."""
         if not user_settings:
-            return []
+            return frozenset()
         if content_type == "movie":
-            return [int(g) for g in user_settings.excluded_movie_genres]
+            return _parse_genre_ids(tuple(user_settings.excluded_movie_genres))
         elif content_type in ["series", "tv"]:
-            return [int(g) for g in user_settings.excluded_series_genres]
-        return []
+            return _parse_genre_ids(tuple(user_settings.excluded_series_genres))
+        return frozenset()
 
     @staticmethod
     def get_genre_multiplier(genre_ids: list[int] | None, whitelist: set[int]) -> float:
@@ -179,12 +213,11 @@ class RecommendationFiltering:
         if not whitelist:
             return 1.0
 
-        gids = set(genre_ids or [])
-        if not gids:
+        if not genre_ids:
             return 1.0
 
         # If it has at least one preferred genre, full score
-        if gids & whitelist:
+        if not whitelist.isdisjoint(genre_ids):
             return 1.0
 
         # Otherwise, soft penalty to prioritize whitelist items without blocking variety
@@ -195,7 +228,6 @@ class RecommendationFiltering:
         """Check if an item's genres match the user's top genre whitelist (Softened)."""
         if not whitelist:
             return True
-        gids = set(genre_ids or [])
-        if not gids:
+        if not genre_ids:
             return True
         return True
@@ -111,24 +111,44 @@ class ItemBasedService:
         """
         combined = {}
 
-        async def fetch_and_combine(fetch_method, source_name, pages: list[int] = [1, 2, 3]):
+        async def fetch_pages(fetch_method, source_name, pages: list[int] = [1, 2, 3]) -> list[dict[str, Any]]:
             results = await asyncio.gather(
                 *[fetch_method(tmdb_id, mtype, page=p) for p in pages],
                 return_exceptions=True,
             )
+            responses = []
             for res in results:
                 if isinstance(res, Exception):
                     logger.warning(f"Error fetching {source_name} for {tmdb_id}: {res}")
                     continue
+                responses.append(res)
+            return responses
+
+        def combine(responses: list[dict[str, Any]]) -> None:
+            for res in responses:
                 for item in res.get("results", []):
                     item_id = item.get("id")
                     if item_id:
                         combined[item_id] = item
 
+        async def fetch_and_combine(fetch_method, source_name, pages: list[int] = [1, 2, 3]):
+            combine(await fetch_pages(fetch_method, source_name, pages))
+
+        # Start only the first similar page alongside recommendations (the cached fetch can't be cancelled,
+        # so anything started here is paid for); pages 2-3 wait until recommendations come up short
+        similar_task = asyncio.create_task(fetch_pages(self.tmdb_service.get_similar, "similar", pages=[1]))
         await fetch_and_combine(self.tmdb_service.get_recommendations, "recommendations")
 
         if not combined or len(combined) < 30:
-            await fetch_and_combine(self.tmdb_service.get_similar, "similar")
+            # Pages 2-3 start as soon as recommendations come up short and overlap the in-flight page 1
+            first_page, more_pages = await asyncio.gather(
+                similar_task, fetch_pages(self.tmdb_service.get_similar, "similar", pages=[2, 3])
+            )
+            combine(first_page)
+            combine(more_pages)
+        else:
+            similar_task.cancel()
+            await asyncio.gather(similar_task, return_exceptions=True)
 
         # apply filter and check
         filtered = filter_items_by_settings(combined.values(), self.user_settings)
@@ -1,4 +1,5 @@
 import asyncio
+from collections.abc import Callable
 from typing import Any
 
 from loguru import logger
@@ -27,7 +28,7 @@ class RecommendationMetadata:
             return None
 
     @classmethod
-    async def format_for_stremio(
+    def format_for_stremio(
         cls,
         details: dict[str, Any],
         media_type: str,
@@ -139,53 +140,98 @@ class RecommendationMetadata:
         items: list[dict[str, Any]],
         media_type: str,
         user_settings: Any = None,
+        target: int | None = None,
+        keep: Callable[[dict[str, Any]], bool] | None = None,
     ) -> list[dict[str, Any]]:
-        """Fetch details for a batch of items in parallel with target-based short-circuiting."""
-        final_results = []
+        """
+        Fetch details for a batch of items in parallel with target-based short-circuiting.
+
+        Items are pulled in rank order by a pool of DEFAULT_CONCURRENCY_LIMIT workers, so one slow
+        request never holds back the others. Results land in per-item slots and are returned in
+        input order.
+
+        Args:
+            target: Optional number of results wanted. Once the first `target` kept items (in rank
+                    order) are complete, the remaining workers are cancelled.
+            keep: Optional predicate applied to each formatted item (e.g. a watched filter)
+        """
         valid_items = [it for it in items if it.get("id")]
-        query_type = "movie" if media_type == "movie" else "tv"
-        sem = asyncio.Semaphore(DEFAULT_CONCURRENCY_LIMIT)
-
-        async def _fetch_one(tid: int):
-            async with sem:
-                try:
-                    if query_type == "movie":
-                        return await tmdb_service.get_movie_details(tid)
-                    return await tmdb_service.get_tv_details(tid)
-                except Exception:
-                    return None
-
-        tasks = [_fetch_one(it.get("id")) for it in valid_items]
-        details_list = await asyncio.gather(*tasks)
+        if not valid_items:
+            return []
 
+        query_type = "movie" if media_type == "movie" else "tv"
         language = getattr(user_settings, "language", None) or "en-US"
-        mt = "movie" if media_type == "movie" else "tv"
 
-        async def _images_one(d: dict[str, Any]) -> dict[str, str]:
-            async with sem:
-                try:
-                    return await tmdb_service.get_images_for_title(mt, d["id"], language=language)
-                except Exception:
-                    return {}
-
-        successful_details = [d for d in details_list if d]
-        image_tasks = [_images_one(d) for d in successful_details]
-        images_list = await asyncio.gather(*image_tasks, return_exceptions=True)
-
-        format_task = []
-        for details, imgs in zip(successful_details, images_list):
+        # One Redis round-trip for every cached detail payload; only misses go out to TMDB
+        try:
+            cached_details = await tmdb_service.get_cached_details_many(query_type, [it["id"] for it in valid_items])
+        except Exception as e:
+            logger.debug(f"Batch details cache read failed: {e}")
+            cached_details = {}
+
+        async def _fetch_details(tid: int) -> dict[str, Any] | None:
+            try:
+                if query_type == "movie":
+                    return await tmdb_service.get_movie_details(tid)
+                else:
+                    return await tmdb_service.get_tv_details(tid)
+            except Exception:
+                return None
+
+        async def _fetch_one(tid: int) -> dict[str, Any] | None:
+            details = cached_details.get(tid)
+            if details is None:
+                details = await _fetch_details(tid)
+            if not details:
+                return None
+
+            # Chain the image lookup so it starts as soon as this item's details land
+            try:
+                imgs = await tmdb_service.get_images_for_title(query_type, details["id"], language=language)
+            except Exception:
+                imgs = None
             logo_url = None
             if isinstance(imgs, dict):
                 logo_url = imgs.get("logo") or None
-            format_task.append(cls.format_for_stremio(details, media_type, user_settings, logo_url=logo_url))
-
-        formatted_list = await asyncio.gather(*format_task, return_exceptions=True)
 
-        for formatted in formatted_list:
-            if isinstance(formatted, Exception):
-                logger.warning(f"Error formatting metadata: {formatted}")
-                continue
-            if formatted:
-                final_results.append(formatted)
+            try:
+                formatted = cls.format_for_stremio(details, media_type, user_settings, logo_url=logo_url)
+            except Exception as e:
+                logger.warning(f"Error formatting metadata: {e}")
+                return None
+            if formatted and (keep is None or keep(formatted)):
+                return formatted
+            return None
 
-        return final_results
+        slots: list[dict[str, Any] | None] = [None] * len(valid_items)
+        completed = [False] * len(valid_items)
+        next_index = 0
+        # Items before `frontier` are all complete; `kept` counts the results among them
+        frontier = 0
+        kept = 0
+
+        async def _worker() -> None:
+            nonlocal next_index, frontier, kept
+            while next_index < len(valid_items):
+                index = next_index
+                next_index += 1
+                slots[index] = await _fetch_one(valid_items[index]["id"])
+                completed[index] = True
+
+                while frontier < len(valid_items) and completed[frontier]:
+                    kept += slots[frontier] is not None
+                    frontier += 1
+                if target is not None and kept >= target:
+                    for worker in workers:
+                        if worker is not asyncio.current_task():
+                            worker.cancel()
+                    return
+
+        workers = [asyncio.create_task(_worker()) for _ in range(min(DEFAULT_CONCURRENCY_LIMIT, len(valid_items)))]
+        for outcome in await asyncio.gather(*workers, return_exceptions=True):
+            # Cancelled workers return CancelledError (a BaseException); anything else is a real failure
+            if isinstance(outcome, Exception):
+                raise outcome
+
+        final_results = [result for result in slots[:frontier] if result is not None]
+        return final_results[:target] if target is not None else final_results
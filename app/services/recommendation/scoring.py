@@ -1,8 +1,12 @@
+import functools
 import hashlib
 import math
 from collections.abc import Callable
+from datetime import date
 from typing import Any
 
+from loguru import logger
+
 from app.core.constants import DEFAULT_MINIMUM_RATING_FOR_THEME_BASED_MOVIE, DEFAULT_MINIMUM_RATING_FOR_THEME_BASED_TV
 
 
@@ -29,12 +33,17 @@ class RecommendationScoring:
         return max(0.0, min(1.0, (value - min_v) / (max_v - min_v)))
 
     @staticmethod
+    @functools.lru_cache(maxsize=8192)
     def stable_epsilon(tmdb_id: int, seed: str) -> float:
-        """Generate a stable tiny epsilon to break ties deterministically."""
+        """
+        Generate a stable tiny epsilon to break ties deterministically.
+
+        Memoized: the seed only changes daily and the same IDs are scored by several catalogs.
+        """
         if not seed:
             return 0.0
-        h = hashlib.md5(f"{seed}:{tmdb_id}".encode()).hexdigest()
-        eps = int(h[-6:], 16) % 1000
+        digest = hashlib.blake2b(f"{seed}:{tmdb_id}".encode(), digest_size=4).digest()
+        eps = int.from_bytes(digest, "little") % 1000
         return eps / 1_000_000.0
 
     @staticmethod
@@ -49,8 +58,6 @@ class RecommendationScoring:
         Returns:
             A seed string like "abc123:2026-01-15"
         """
-        from datetime import date
-
         today = date.today().isoformat()
         if token:
             return f"{token}:{today}"
@@ -130,6 +137,7 @@ class RecommendationScoring:
         scorer: Any,
         mtype: str,
         rotation_seed: str | None = None,
+        normalized_profile: dict[str, dict[Any, float]] | None = None,
     ) -> float:  # noqa: E501
         """
         Calculate final recommendation score combining profile similarity and quality.
@@ -142,12 +150,14 @@ class RecommendationScoring:
             rotation_seed: Optional seed for daily rotation (e.g., "token:2026-01-15").
                           When provided, adds a tiny epsilon for deterministic tie-breaking
                           that changes daily, making recommendations feel fresh.
+            normalized_profile: Optional pre-computed profile.normalize_for_ranking() output,
+                          shared across all candidates of a scoring pass.
 
         Returns:
             Final combined score (0-1 range, with optional epsilon for rotation)
         """
         # Score with profile
-        profile_score = scorer.score_item(item, profile)
+        profile_score = scorer.score_item(item, profile, normalized=normalized_profile)
 
         # Calculate weighted rating
         C = (
@@ -160,7 +170,8 @@ class RecommendationScoring:
             item.get("vote_count"),
             C=C,
         )
-        quality_score = RecommendationScoring.normalize(wr)
+        # Inlined normalize(wr) for the fixed 0-10 scale: this runs for every scored candidate
+        quality_score = min(1.0, max(0.0, wr / 10.0))
 
         # Simple weighted combination: profile match is primary, quality ensures no bad items
         base_score = (profile_score * 0.70) + (quality_score * 0.30)
@@ -176,3 +187,35 @@ class RecommendationScoring:
             final_score += epsilon
 
         return final_score
+
+    @staticmethod
+    def score_candidates(
+        items: list[dict[str, Any]],
+        profile: Any,
+        scorer: Any,
+        mtype: str,
+        rotation_seed: str | None = None,
+        skip_errors: bool = True,
+    ) -> list[tuple[float, dict[str, Any]]]:
+        """
+        Score a batch of candidates against one profile.
+
+        Per-batch work (profile normalization, method lookups) is done once up front.
+        Items that fail to score are skipped when skip_errors is set, otherwise the error propagates.
+
+        Returns:
+            List of (final_score, item) tuples in input order
+        """
+        normalized_profile = profile.normalize_for_ranking()
+        calculate = RecommendationScoring.calculate_final_score
+        scored = []
+        for item in items:
+            try:
+                score = calculate(item, profile, scorer, mtype, rotation_seed, normalized_profile)
+            except Exception as e:
+                if not skip_errors:
+                    raise
+                logger.debug(f"Failed to score item {item.get('id')}: {e}")
+                continue
+            scored.append((score, item))
+        return scored
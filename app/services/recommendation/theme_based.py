@@ -1,4 +1,5 @@
 import asyncio
+import heapq
 from typing import Any
 
 from loguru import logger
@@ -18,10 +19,13 @@ from app.services.recommendation.utils import (
     apply_discover_filters,
     content_type_to_mtype,
     filter_by_genres,
-    filter_watched_by_imdb,
+    is_watched_by_imdb,
 )
 from app.services.tmdb.service import TMDBService
 
+# Themes with at least this many axes start their per-axis (Phase 2) fetches alongside Phase 1
+SPECULATIVE_PHASE2_MIN_AXES = 3
+
 
 class ThemeBasedService:
     """
@@ -83,6 +87,43 @@ class ThemeBasedService:
                     combined_params["without_genres"] = "|".join(str(g) for g in without)
             fetch_tasks.append(self._fetch_discover_candidates(content_type, combined_params, pages=[1, 2, 3]))
 
+        # ====================
+        # PHASE 2: Individual Axes (if sparse)
+        # ====================
+        individual_params = []
+
+        # For EACH axis in anchors, flavors, AND fallbacks
+        for axis_name, axis_value in all_constraints.items():
+            # Build params for this single axis
+            params = self._axes_to_params({axis_name: axis_value}, content_type)
+
+            # ALWAYS add mandatory filters (country/era) if they exist and are not the current axis
+            for filter_name, filter_value in mandatory_filters.items():
+                if filter_name != axis_name:  # Don't duplicate
+                    filter_params = self._axes_to_params({filter_name: filter_value}, content_type)
+                    params.update(filter_params)
+
+            # Apply excluded genres
+            if excluded_ids:
+                with_ids = {int(g) for g in params.get("with_genres", "").split("|") if g}
+                without = [g for g in excluded_ids if g not in with_ids]
+                if without:
+                    params["without_genres"] = "|".join(str(g) for g in without)
+
+            individual_params.append(params)
+
+        def _start_individual_fetches() -> list[asyncio.Task]:
+            return [
+                asyncio.create_task(self._fetch_discover_candidates(content_type, params, pages=[1, 2]))
+                for params in individual_params
+            ]
+
+        # Themes with many axes rarely fill the buffer from the combined query alone, so start their
+        # per-axis fetches alongside Phase 1 (one round-trip instead of two). Other themes only pay for
+        # them when Phase 1 comes up short; the discover cache shields its requests from cancellation.
+        speculative = len(all_constraints) >= SPECULATIVE_PHASE2_MIN_AXES
+        individual_tasks = _start_individual_fetches() if speculative else []
+
         # Execute Phase 1
         results = await asyncio.gather(*fetch_tasks, return_exceptions=True)
         candidates = []
@@ -97,34 +138,11 @@ class ThemeBasedService:
 
         logger.info(f"Phase 1 (combined): {len(candidates)} candidates")
 
-        # ====================
-        # PHASE 2: Individual Axes (if sparse)
-        # ====================
         if len(candidates) < limit * 2:
-            fetch_tasks = []
-
-            # For EACH axis in anchors, flavors, AND fallbacks
-            for axis_name, axis_value in all_constraints.items():
-                # Build params for this single axis
-                params = self._axes_to_params({axis_name: axis_value}, content_type)
-
-                # ALWAYS add mandatory filters (country/era) if they exist and are not the current axis
-                for filter_name, filter_value in mandatory_filters.items():
-                    if filter_name != axis_name:  # Don't duplicate
-                        filter_params = self._axes_to_params({filter_name: filter_value}, content_type)
-                        params.update(filter_params)
-
-                # Apply excluded genres
-                if excluded_ids:
-                    with_ids = {int(g) for g in params.get("with_genres", "").split("|") if g}
-                    without = [g for g in excluded_ids if g not in with_ids]
-                    if without:
-                        params["without_genres"] = "|".join(str(g) for g in without)
-
-                fetch_tasks.append(self._fetch_discover_candidates(content_type, params, pages=[1, 2]))
-
             # Execute Phase 2
-            results = await asyncio.gather(*fetch_tasks, return_exceptions=True)
+            if not speculative:
+                individual_tasks = _start_individual_fetches()
+            results = await asyncio.gather(*individual_tasks, return_exceptions=True)
             for res in results:
                 if isinstance(res, Exception):
                     logger.debug(f"Error fetching individual: {res}")
@@ -135,6 +153,10 @@ class ThemeBasedService:
                     candidates.extend(res)
 
             logger.info(f"Phase 2 (individual): Total {len(candidates)} candidates")
+        else:
+            for task in individual_tasks:
+                task.cancel()
+            await asyncio.gather(*individual_tasks, return_exceptions=True)
 
         # 4. Expansion Logic if still sparse
         if len(candidates) < limit and anchors:
@@ -147,26 +169,24 @@ class ThemeBasedService:
             candidates.extend(expanded)
 
         # 5. Weighted Scoring
-        scored = []
         rotation_seed = RecommendationScoring.generate_rotation_seed()
         mtype = content_type_to_mtype(content_type)
+        # Drop watched items up front so they are never scored
+        candidates = [item for item in candidates if item["id"] not in watched_tmdb]
+        # Profile & quality scores are computed in one batch so the profile is normalized once
+        if profile:
+            base_scored = RecommendationScoring.score_candidates(
+                candidates, profile, self.scorer, mtype, rotation_seed, skip_errors=False
+            )
+        else:
+            base_scored = [(RecommendationScoring.normalize(item.get("vote_average", 0)), item) for item in candidates]
 
-        for item in candidates:
+        # Keep the best-scored entry per ID while scoring, instead of a separate dedup pass
+        best_by_id: dict[int, tuple[float, dict[str, Any]]] = {}
+        for base_score, item in base_scored:
             # Theme Match Score
             theme_match = self._calculate_theme_score(item, anchors, flavors, fallbacks)
 
-            # Profile & Quality Score
-            if profile:
-                base_score = RecommendationScoring.calculate_final_score(
-                    item=item,
-                    profile=profile,
-                    scorer=self.scorer,
-                    mtype=mtype,
-                    rotation_seed=rotation_seed,
-                )
-            else:
-                base_score = RecommendationScoring.normalize(item.get("vote_average", 0))
-
             # Combine: theme match is the primary sorter for catalog rows
             final_score = (theme_match * 0.7) + (base_score * 0.3)
 
@@ -175,23 +195,24 @@ class ThemeBasedService:
             if tier == "combined":
                 final_score *= 2.0  # Boost combined matches to appear first
 
-            scored.append((final_score, item))
+            item_id = item["id"]
+            current = best_by_id.get(item_id)
+            if current is None or final_score > current[0]:
+                best_by_id[item_id] = (final_score, item)
 
         # 6. Rank and Enrich
-        scored.sort(key=lambda x: x[0], reverse=True)
-        unique_results = []
-        seen = set()
-        for _, item in scored:
-            if item["id"] not in seen and item["id"] not in watched_tmdb:
-                unique_results.append(item)
-                seen.add(item["id"])
-            if len(unique_results) >= limit * 2:
-                break
-
-        enriched = await RecommendationMetadata.fetch_batch(
-            self.tmdb_service, unique_results, content_type, user_settings=self.user_settings
+        # Take only the buffer we need instead of sorting everything
+        unique_results = [item for _, item in heapq.nlargest(limit * 2, best_by_id.values(), key=lambda x: x[0])]
+
+        # Stop enriching once `limit` unwatched items are ready
+        return await RecommendationMetadata.fetch_batch(
+            self.tmdb_service,
+            unique_results,
+            content_type,
+            user_settings=self.user_settings,
+            target=limit,
+            keep=lambda meta: not is_watched_by_imdb(meta, watched_imdb),
         )
-        return filter_watched_by_imdb(enriched, watched_imdb)[:limit]
 
     def _parse_theme_id(self, theme_id: str) -> tuple[dict, dict, dict]:
         """Parse role-based ID: watchly.theme.a:g123.f:k456.b:y1990"""
@@ -278,39 +299,10 @@ class ThemeBasedService:
         """Calculate weighted score based on axis matches."""
         score = 0.0
 
-        def check_match(axis_name, value):
-            if axis_name == "genre":
-                item_genres = [str(gid) for gid in item.get("genre_ids", [])]
-                target_genres = str(value).split("-")
-                return any(tg in item_genres for tg in target_genres)
-            if axis_name == "keyword":
-                return True  # Optimistic match for discovery items
-            if axis_name == "country":
-                item_countries = item.get("origin_country", [])
-                return value in item_countries
-            if axis_name == "era":
-                rel = item.get("release_date") or item.get("first_air_date")
-                if rel:
-                    try:
-                        y = int(rel[:4])
-                        if "-" in value:
-                            start, end = map(int, value.split("-"))
-                        else:
-                            start = int(value)
-                            end = start + 9
-                        return start <= y <= end
-                    except Exception:
-                        logger.error("Failed to parse era axis: {}", value)
-                        pass
-            if axis_name == "runtime":
-                # Runtimes are hard to match exactly from discover results without metadata enrichment
-                return True
-            return False
-
         total_anchors = len(anchors)
         matched_anchors = 0
         for name, val in anchors.items():
-            if check_match(name, val):
+            if self._axis_matches(item, name, val):
                 score += 1.0
                 matched_anchors += 1
 
@@ -322,14 +314,45 @@ class ThemeBasedService:
             score += (matched_anchors / total_anchors) * 0.5
 
         for name, val in flavors.items():
-            if check_match(name, val):
+            if self._axis_matches(item, name, val):
                 score += 0.7
         for name, val in fallbacks.items():
-            if check_match(name, val):
+            if self._axis_matches(item, name, val):
                 score += 0.3
 
         return score
 
+    @staticmethod
+    def _axis_matches(item: dict, axis_name: str, value: Any) -> bool:
+        """Check whether a discovery item satisfies a single theme axis."""
+        if axis_name == "genre":
+            item_genres = [str(gid) for gid in item.get("genre_ids", ())]
+            target_genres = str(value).split("-")
+            return any(tg in item_genres for tg in target_genres)
+        if axis_name == "keyword":
+            return True  # Optimistic match for discovery items
+        if axis_name == "country":
+            item_countries = item.get("origin_country", [])
+            return value in item_countries
+        if axis_name == "era":
+            rel = item.get("release_date") or item.get("first_air_date")
+            if rel:
+                try:
+                    y = int(rel[:4])
+                    if "-" in value:
+                        start, end = map(int, value.split("-"))
+                    else:
+                        start = int(value)
+                        end = start + 9
+                    return start <= y <= end
+                except Exception:
+                    logger.error("Failed to parse era axis: {}", value)
+                    pass
+        if axis_name == "runtime":
+            # Runtimes are hard to match exactly from discover results without metadata enrichment
+            return True
+        return False
+
     async def _expand_search(self, content_type: str, params: dict, anchors: dict, flavors: dict) -> list[dict]:
         """Expansion logic if results are sparse."""
         # 1. Relax Keyword: Remove keyword constraint
@@ -1,6 +1,5 @@
 import asyncio
 import time
-from collections import defaultdict
 from datetime import date, datetime
 from typing import Any
 
@@ -80,35 +79,19 @@ class TopPicksService:
         logger.info(f"Starting top picks generation for {content_type}, target limit={limit}")
 
         mtype = content_type_to_mtype(content_type)
-        all_candidates = {}
 
-        # 1. Fetch recommendations from top items
-        # Use Simkl if API key available, otherwise fall back to TMDB
-        simkl_api_key = self.user_settings.simkl_api_key if self.user_settings else None
-        if simkl_api_key:
-            rec_candidates = await self._fetch_simkl_recommendations(library_items, content_type, mtype)
-            if not rec_candidates:
-                # Fallback to TMDB if Simkl returns nothing
-                logger.info("Simkl returned no results, falling back to TMDB")
-                rec_candidates = await self._fetch_recommendations_from_top_items(library_items, content_type, mtype)
-                # filter items
-                rec_candidates = filter_items_by_settings(rec_candidates, self.user_settings, simkl=True)
-        else:
-            rec_candidates = await self._fetch_recommendations_from_top_items(library_items, content_type, mtype)
-            # filter items
-            rec_candidates = filter_items_by_settings(rec_candidates, self.user_settings)
-
-        for item in rec_candidates:
-            if item.get("id"):
-                all_candidates[item["id"]] = item
-
-        # 2. Fetch discover with profile features
-        discover_candidates = await self._fetch_discover_with_profile(profile, content_type, mtype)
+        # 1 & 2. Fetch recommendations from top items and discover with profile features (independent, so concurrent)
+        rec_candidates, discover_candidates = await asyncio.gather(
+            self._fetch_rec_candidates(library_items, content_type, mtype),
+            self._fetch_discover_with_profile(profile, content_type, mtype),
+        )
         # filter by user settings
         discover_candidates = filter_items_by_settings(discover_candidates, self.user_settings)
-        for item in discover_candidates:
-            if item.get("id"):
-                all_candidates[item["id"]] = item
+
+        # 3. Merge candidates deduped by TMDB ID (discover entries override recommendation entries)
+        all_candidates = {item["id"]: item for item in rec_candidates if item.get("id")} | {
+            item["id"]: item for item in discover_candidates if item.get("id")
+        }
 
         # Filter out watched items
         filtered_candidates = [item for item in all_candidates.values() if item.get("id") not in watched_tmdb]
@@ -116,21 +99,10 @@ class TopPicksService:
         logger.info(f"Found {len(filtered_candidates)} candidates after filtering out watched items and user settings")
 
         #  Score all candidates with profile
-        scored_candidates = []
         rotation_seed = RecommendationScoring.generate_rotation_seed()  # Daily rotation for fresh recommendations
-        for item in filtered_candidates:
-            try:
-                final_score = RecommendationScoring.calculate_final_score(
-                    item=item,
-                    profile=profile,
-                    scorer=self.scorer,
-                    mtype=mtype,
-                    rotation_seed=rotation_seed,
-                )
-                scored_candidates.append((final_score, item))
-            except Exception as e:
-                logger.debug(f"Failed to score item {item.get('id')}: {e}")
-                continue
+        scored_candidates = RecommendationScoring.score_candidates(
+            filtered_candidates, profile, self.scorer, mtype, rotation_seed=rotation_seed
+        )
 
         # Sort by score
         scored_candidates.sort(key=lambda x: x[0], reverse=True)
@@ -184,33 +156,26 @@ class TopPicksService:
         # Get top items (loved first, then liked, then added, then top watched)
         top_items = self.smart_sampler.sample_items(library_items, content_type, max_items=15)
 
-        candidates = []
-        tasks = []
-
-        for item in top_items:
-            item = item.item
-            item_id = item.id
-            if not item_id:
-                continue
-
-            # Resolve TMDB ID
+        async def fetch_for_item(item_id: str) -> dict[str, Any]:
+            # Resolve TMDB ID, then fetch recommendations (1 page only)
             tmdb_id = await resolve_tmdb_id(item_id, self.tmdb_service)
             if not tmdb_id:
-                continue
+                return {}
+            return await self.tmdb_service.get_recommendations(tmdb_id, mtype, page=1)
 
-            # Fetch recommendations (1 page only)
-            tasks.append(self.tmdb_service.get_recommendations(tmdb_id, mtype, page=1))
-            # tasks.append(self.tmdb_service.get_similar(tmdb_id, mtype, page=1))
+        candidates = []
+        # Resolution and fetch run per item, so IMDb lookups no longer serialize ahead of the fetches
+        tasks = [fetch_for_item(item.item.id) for item in top_items if item.item.id]
 
-        # Execute all in parallel
+        # Execute all in parallel, collecting each source as soon as it returns
         logger.info(f"Fetching recommendations from {len(tasks)} top library items")
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
         failed_count = 0
-        for res in results:
-            if isinstance(res, Exception):
+        for fut in asyncio.as_completed(tasks):
+            try:
+                res = await fut
+            except Exception as e:
                 failed_count += 1
-                logger.debug(f"Recommendation fetch failed: {res}")
+                logger.debug(f"Recommendation fetch failed: {e}")
                 continue
             candidates.extend(res.get("results", []))
 
@@ -438,6 +403,25 @@ class TopPicksService:
 
         return candidates
 
+    async def _fetch_rec_candidates(
+        self, library_items: dict[str, list[dict[str, Any]]], content_type: str, mtype: str
+    ) -> list[dict[str, Any]]:
+        """Fetch recommendations from top items, using Simkl if an API key is available, otherwise TMDB."""
+        simkl_api_key = self.user_settings.simkl_api_key if self.user_settings else None
+        if simkl_api_key:
+            rec_candidates = await self._fetch_simkl_recommendations(library_items, content_type, mtype)
+            if rec_candidates:
+                return rec_candidates
+            # Fallback to TMDB if Simkl returns nothing
+            logger.info("Simkl returned no results, falling back to TMDB")
+            rec_candidates = await self._fetch_recommendations_from_top_items(library_items, content_type, mtype)
+            # filter items
+            return filter_items_by_settings(rec_candidates, self.user_settings, simkl=True)
+
+        rec_candidates = await self._fetch_recommendations_from_top_items(library_items, content_type, mtype)
+        # filter items
+        return filter_items_by_settings(rec_candidates, self.user_settings)
+
     def _apply_diversity_caps(
         self,
         scored_candidates: list[tuple[float, dict[str, Any]]],
@@ -461,12 +445,16 @@ class TopPicksService:
             Filtered and capped list of items
         """
         result = []
-        genre_counts = defaultdict(int)
-        # era_counts = defaultdict(int)
+        genre_counts: dict[int, int] = {}
+        # era_counts: dict[str, int] = {}
 
         max_per_genre = int(limit * TOP_PICKS_GENRE_CAP)
         # max_per_era = int(limit * TOP_PICKS_ERA_CAP)
 
+        # Quality thresholds only depend on user settings and media type, not on the candidate
+        min_rating, min_votes = RecommendationFiltering.get_quality_thresholds(self.user_settings)
+        wr_prior = 7.2 if mtype == "tv" else 6.8
+
         for score, item in scored_candidates:
             if len(result) >= limit:
                 break
@@ -480,29 +468,27 @@ class TopPicksService:
             vote_avg = item.get("vote_average", 0)
 
             # Dynamic check
-            min_rating, min_votes = RecommendationFiltering.get_quality_thresholds(self.user_settings)
-
             if vote_count < min_votes:
                 continue
 
             # We keep weighted rating check but use dynamic base
-            wr = RecommendationScoring.weighted_rating(vote_avg, vote_count, C=7.2 if mtype == "tv" else 6.8)
+            wr = RecommendationScoring.weighted_rating(vote_avg, vote_count, C=wr_prior)
             if wr < min_rating:
                 continue
 
             # Check genre cap (50% max per genre)
-            genre_ids = item.get("genre_ids", [])
+            genre_ids = item.get("genre_ids", ())
             top_genre = genre_ids[0] if genre_ids else None
 
             if top_genre:
-                if genre_counts[top_genre] >= max_per_genre:
+                if genre_counts.get(top_genre, 0) >= max_per_genre:
                     continue
 
             # Add item
             result.append(item)
 
             if top_genre:
-                genre_counts[top_genre] += 1
+                genre_counts[top_genre] = genre_counts.get(top_genre, 0) + 1
 
         return result
 
@@ -518,7 +504,7 @@ class TopPicksService:
             Filtered list respecting creator cap
         """
         result = []
-        creator_counts = defaultdict(int)
+        creator_counts: dict[int, int] = {}
 
         for item in items:
             if len(result) >= limit:
@@ -533,7 +519,7 @@ class TopPicksService:
             directors = [c.get("id") for c in crew if c.get("job", "").lower() == "director" and c.get("id")]
             blocked_by_director = False
             for dir_id in directors:
-                if creator_counts[dir_id] >= TOP_PICKS_CREATOR_CAP:
+                if creator_counts.get(dir_id, 0) >= TOP_PICKS_CREATOR_CAP:
                     blocked_by_director = True
                     break
 
@@ -541,7 +527,7 @@ class TopPicksService:
             top_cast = [c.get("id") for c in cast[:3] if c.get("id")]
             blocked_by_cast = False
             for cast_id in top_cast:
-                if creator_counts[cast_id] >= TOP_PICKS_CREATOR_CAP:
+                if creator_counts.get(cast_id, 0) >= TOP_PICKS_CREATOR_CAP:
                     blocked_by_cast = True
                     break
 
@@ -553,9 +539,9 @@ class TopPicksService:
 
             # Update creator counts
             for dir_id in directors:
-                creator_counts[dir_id] += 1
+                creator_counts[dir_id] = creator_counts.get(dir_id, 0) + 1
             for cast_id in top_cast:
-                creator_counts[cast_id] += 1
+                creator_counts[cast_id] = creator_counts.get(cast_id, 0) + 1
 
         return result
 
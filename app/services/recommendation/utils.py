@@ -1,3 +1,5 @@
+import asyncio
+import operator
 from typing import Any
 
 from loguru import logger
@@ -6,9 +8,11 @@ from app.core.constants import DISCOVERY_SETTINGS
 from app.services.recommendation.filtering import RecommendationFiltering
 from app.services.recommendation.metadata import RecommendationMetadata
 
+_MTYPE_MAP: dict[str, str] = {"tv": "tv", "series": "tv", "movie": "movie"}
+
 
 def content_type_to_mtype(content_type: str) -> str:
-    return "tv" if content_type in ("tv", "series") else "movie"
+    return _MTYPE_MAP.get(content_type, "movie")
 
 
 async def resolve_tmdb_id(item_id: str, tmdb_service: Any) -> int | None:
@@ -52,49 +56,51 @@ def filter_watched_by_imdb(enriched: list[dict[str, Any]], watched_imdb: set[str
     Returns:
         Filtered list excluding watched items
     """
-    final = []
-    for item in enriched:
-        if item.get("id") in watched_imdb:
-            continue
-        if item.get("_external_ids", {}).get("imdb_id") in watched_imdb:
-            continue
-        final.append(item)
-    return final
+    return [item for item in enriched if not is_watched_by_imdb(item, watched_imdb)]
+
+
+def is_watched_by_imdb(item: dict[str, Any], watched_imdb: set[str]) -> bool:
+    """Check an enriched item's 'id' and '_external_ids.imdb_id' against watched IMDB IDs."""
+    return item.get("id") in watched_imdb or item.get("_external_ids", {}).get("imdb_id") in watched_imdb
 
 
 def filter_by_genres(
     items: list[dict[str, Any]],
     watched_tmdb: set[int],
     whitelist: set[int] | None = None,
-    excluded_ids: list[int] | None = None,
+    excluded_ids: frozenset[int] | None = None,
 ) -> list[dict[str, Any]]:
     """
     Filter items by genre whitelist and excluded genres.
 
+    Items are also deduplicated by TMDB ID (first occurrence wins), so merged sources
+    don't enrich or return the same title twice.
+
     Args:
         items: List of candidate items
         watched_tmdb: Set of watched TMDB IDs to exclude
         whitelist: Optional genre whitelist
-        excluded_ids: Optional list of excluded genre IDs
+        excluded_ids: Optional set of excluded genre IDs
 
     Returns:
         Filtered list of items
     """
     whitelist = whitelist or set()
-    excluded_ids = excluded_ids or []
     filtered = []
+    seen: set[int] = set()
 
     for item in items:
         item_id = item.get("id")
-        if not item_id or item_id in watched_tmdb:
+        if not item_id or item_id in watched_tmdb or item_id in seen:
             continue
 
-        genre_ids = item.get("genre_ids", [])
+        genre_ids = item.get("genre_ids", ())
 
         # Excluded genres check
-        if excluded_ids and any(gid in excluded_ids for gid in genre_ids):
+        if excluded_ids and not excluded_ids.isdisjoint(genre_ids):
             continue
 
+        seen.add(item_id)
         filtered.append(item)
 
     return filtered
@@ -131,20 +137,24 @@ async def pad_to_min(
     # Use provided watched sets (or empty sets if not provided)
     watched_tmdb = watched_tmdb or set()
     watched_imdb = watched_imdb or set()
-    excluded_ids = set(RecommendationFiltering.get_excluded_genre_ids(user_settings, content_type))
+    excluded_ids = RecommendationFiltering.get_excluded_genre_ids(user_settings, content_type)
 
     mtype = content_type_to_mtype(content_type)
     pool = []
 
     try:
-        tr = await tmdb_service.get_trending(mtype, time_window="week")
+        tr, tr2 = await asyncio.gather(
+            tmdb_service.get_trending(mtype, time_window="week"), tmdb_service.get_top_rated(mtype)
+        )
         pool.extend(tr.get("results", [])[:60])
-        tr2 = await tmdb_service.get_top_rated(mtype)
         pool.extend(tr2.get("results", [])[:60])
     except Exception as e:
         logger.debug(f"Error fetching trending/top-rated for padding: {e}")
         return existing
 
+    # Cheap quality threshold first so the settings and dedup passes only see viable items
+    pool = [it for it in pool if int(it.get("vote_count") or 0) >= 200 and float(it.get("vote_average") or 0.0) >= 6.0]
+
     # Filter pool by user settings (years, popularity)
     pool = filter_items_by_settings(pool, user_settings)
 
@@ -165,13 +175,8 @@ async def pad_to_min(
         tid = it.get("id")
         if not tid or tid in existing_tmdb or tid in watched_tmdb:
             continue
-        gids = it.get("genre_ids") or []
-        if excluded_ids.intersection(gids):
-            continue
-
-        # Quality threshold
-        va, vc = float(it.get("vote_average") or 0.0), int(it.get("vote_count") or 0)
-        if vc < 200 or va < 6.0:
+        gids = it.get("genre_ids") or ()
+        if not excluded_ids.isdisjoint(gids):
             continue
         dedup[tid] = it
         if len(dedup) >= need * 3:
@@ -281,6 +286,23 @@ def filter_items_by_settings(
     year_max = getattr(user_settings, "year_max", 2026)
     pop_pref = getattr(user_settings, "popularity", "balanced")
 
+    params = DISCOVERY_SETTINGS.get(pop_pref, {})
+    if not params:
+        return []
+
+    # Resolve the discovery params into (field, operator, threshold) checks once, not per item
+    ops = {"gte": operator.ge, "lte": operator.le}
+    checks = []
+    for param, threshold in params.items():
+        t_param, param_ops = param.split(".")
+        param_operator = ops.get(param_ops)
+        if not param_operator:
+            continue
+        # skip popularity params if simkl
+        if simkl and t_param == "popularity":
+            continue
+        checks.append((t_param, param_operator, threshold))
+
     filtered = []
 
     for item in items:
@@ -294,29 +316,11 @@ def filter_items_by_settings(
             except (ValueError, IndexError):
                 pass
 
-        params = DISCOVERY_SETTINGS.get(pop_pref, {})
-        if not params:
-            continue
-
-        # determine operations
-        ops = {
-            "gte": lambda x, y: x >= y,
-            "lte": lambda x, y: x <= y,
-        }
-
+        # 2. Discovery thresholds (popularity, rating, votes)
         passes_all_checks = True
-        for param in params:
-            t_param, param_ops = param.split(".")
-            param_operator = ops.get(param_ops)
-            if not param_operator:
-                continue
-
-            # skip popularity params if simkl
-            if simkl and t_param == "popularity":
-                continue
-
+        for t_param, param_operator, threshold in checks:
             item_value = item.get(t_param)
-            if item_value is None or not param_operator(item_value, params[param]):
+            if item_value is None or not param_operator(item_value, threshold):
                 passes_all_checks = False
                 break
 
@@ -15,16 +15,21 @@ class RedisService:
     async def get_client(self) -> redis.Redis:
         if self._client is None:
             logger.info("Creating Redis client for RedisService")
-            self._client = redis.from_url(
+            # Blocking pool: under bursts, callers wait (up to `timeout`) for a free connection
+            # instead of failing with "Too many connections" once max_connections is reached
+            pool = redis.BlockingConnectionPool.from_url(
                 settings.REDIS_URL,
                 decode_responses=True,
                 encoding="utf-8",
                 socket_connect_timeout=5,
                 socket_timeout=5,
                 max_connections=getattr(settings, "REDIS_MAX_CONNECTIONS", 100),
+                timeout=5,
                 health_check_interval=30,
                 socket_keepalive=True,
             )
+            # The client owns the pool and disconnects it on close()
+            self._client = redis.Redis.from_pool(pool)
         return self._client
 
     async def set(self, key: str, value: Any, ttl: int | None = None) -> bool:
@@ -67,6 +72,24 @@ class RedisService:
             logger.error(f"Failed to get key '{key}' from Redis: {exc}")
             return None
 
+    async def mget(self, keys: list[str]) -> list[str | None]:
+        """Get several values from Redis in one round-trip.
+
+        Args:
+            keys: The keys to retrieve
+
+        Returns:
+            Values in the same order as keys (None for missing keys, or for all keys if an error occurred)
+        """
+        if not keys:
+            return []
+        try:
+            client = await self.get_client()
+            return await client.mget(keys)
+        except (redis.RedisError, OSError) as exc:
+            logger.error(f"Failed to mget {len(keys)} keys from Redis: {exc}")
+            return [None] * len(keys)
+
     async def delete(self, key: str) -> bool:
         """Delete a key from Redis.
 
@@ -114,13 +137,14 @@ class RedisService:
             client = await self.get_client()
             deleted_count = 0
             keys_to_delete = []
-            async for key in client.scan_iter(match=pattern, count=500):
+            # UNLINK frees the values in a background thread, so large batches don't block Redis
+            async for key in client.scan_iter(match=pattern, count=1000):
                 keys_to_delete.append(key)
-                if len(keys_to_delete) >= 500:
-                    deleted_count += await client.delete(*keys_to_delete)
+                if len(keys_to_delete) >= 1000:
+                    deleted_count += await client.unlink(*keys_to_delete)
                     keys_to_delete = []
             if keys_to_delete:
-                deleted_count += await client.delete(*keys_to_delete)
+                deleted_count += await client.unlink(*keys_to_delete)
             return deleted_count
         except (redis.RedisError, OSError) as exc:
             logger.error(f"Failed to delete keys matching pattern '{pattern}' in Redis: {exc}")
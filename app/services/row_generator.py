@@ -7,8 +7,9 @@ Generates 3 personalized catalog rows using a tiered sampling system:
 - Row 3 (The Rising Star): Emerging interests (Silver tier: Rank 4-10)
 """
 
-import asyncio
+import functools
 import random
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
 
@@ -25,6 +26,9 @@ GOLD_TIER_LIMIT = 3  # Top 1-3 items
 SILVER_TIER_START = 3  # Rank 4+
 SILVER_TIER_END = 10  # Up to Rank 10
 
+# Shared unseeded generator, used when generate_rows is not given a seed
+_default_rng = random.Random()
+
 # Available axes for row generation
 AXIS_GENRE = "genre"
 AXIS_KEYWORD = "keyword"
@@ -32,6 +36,12 @@ AXIS_COUNTRY = "country"
 AXIS_RUNTIME = "runtime"
 AXIS_CREATOR = "creator"
 
+# Flavor axis types The Blend picks from (uniformly)
+BLEND_FLAVOR_TYPES = (AXIS_COUNTRY, AXIS_GENRE)
+
+# Title axis shapes (sorted names) whose template title is good enough to skip Gemini
+LOCAL_TITLE_SHAPES = {(AXIS_COUNTRY, AXIS_GENRE)}
+
 
 class AxisRole(str, Enum):
     ANCHOR = "anchor"  # strong signal, near-required
@@ -39,13 +49,15 @@ class AxisRole(str, Enum):
     FALLBACK = "fallback"  # ranking only, never filtering
 
 
-class RowAxis(BaseModel):
+@dataclass(slots=True, frozen=True)
+class RowAxis:
     name: str
     value: Any
     role: AxisRole
     weight: float = 1.0
 
 
+@functools.lru_cache(maxsize=512)
 def normalize_keyword(kw: str) -> str:
     """Normalize keyword for display."""
     return kw.strip().replace("-", " ").replace("_", " ").title()
@@ -57,76 +69,88 @@ def get_genre_name(genre_id: int, content_type: str) -> str:
     return genre_map.get(genre_id, "Movies" if content_type == "movie" else "Series")
 
 
-def get_country_adjective(country_code: str) -> str | None:
+def get_country_adjective(country_code: str, rng: random.Random = _default_rng) -> str | None:
     """Get country adjective (e.g., 'US' -> 'American')."""
     adjectives = COUNTRY_ADJECTIVES.get(country_code, [])
-    return random.choice(adjectives) if adjectives else None
+    return rng.choice(adjectives) if adjectives else None
+
+
+RUNTIME_MODIFIERS: dict[str, str | None] = {
+    "short": "Short & Sweet",
+    "medium": None,  # No modifier for medium
+    "long": "Epic",
+}
 
 
 def runtime_to_modifier(bucket: str) -> str | None:
     """Get display modifier for runtime bucket."""
-    modifiers = {
-        "short": "Short & Sweet",
-        "medium": None,  # No modifier for medium
-        "long": "Epic",
-    }
-    return modifiers.get(bucket)
+    return RUNTIME_MODIFIERS.get(bucket)
 
 
-def sample_from_tier(items: list[tuple[Any, float]], start: int, end: int, count: int = 1) -> list[tuple[Any, float]]:
+def sample_from_tier(
+    items: list[tuple[Any, float]], start: int, end: int, count: int = 1, rng: random.Random = _default_rng
+) -> list[tuple[Any, float]]:
     """Sample random items from a specific tier range."""
-    tier_items = items[start:end]
-    if not tier_items:
+    tier_size = min(end, len(items)) - start
+    if tier_size <= 0 or count <= 0:
         return []
-    return random.sample(tier_items, min(count, len(tier_items)))
+    # Single picks (the common case) index straight into the list without slicing
+    if count == 1:
+        return [items[start + rng.randrange(tier_size)]]
+    # Profile feature lists are short (top 2-10), so the tier often covers the whole list; skip the copy then
+    tier_items = items if start == 0 and end >= len(items) else items[start:end]
+    return rng.sample(tier_items, min(count, tier_size))
 
 
-def sample_from_gold(items: list[tuple[Any, float]], count: int = 1) -> list[tuple[Any, float]]:
+def sample_from_gold(
+    items: list[tuple[Any, float]], count: int = 1, rng: random.Random = _default_rng
+) -> list[tuple[Any, float]]:
     """Sample from Gold tier (Top 1-3)."""
-    return sample_from_tier(items, 0, GOLD_TIER_LIMIT, count)
+    return sample_from_tier(items, 0, GOLD_TIER_LIMIT, count, rng)
 
 
-def sample_from_silver(items: list[tuple[Any, float]], count: int = 1) -> list[tuple[Any, float]]:
+def sample_from_silver(
+    items: list[tuple[Any, float]], count: int = 1, rng: random.Random = _default_rng
+) -> list[tuple[Any, float]]:
     """Sample from Silver tier (Rank 4-10)."""
-    return sample_from_tier(items, SILVER_TIER_START, SILVER_TIER_END, count)
+    return sample_from_tier(items, SILVER_TIER_START, SILVER_TIER_END, count, rng)
 
 
-def sample_from_gold_silver(items: list[tuple[Any, float]], count: int = 1) -> list[tuple[Any, float]]:
+def sample_from_gold_silver(
+    items: list[tuple[Any, float]], count: int = 1, rng: random.Random = _default_rng
+) -> list[tuple[Any, float]]:
     """Sample from combined Gold+Silver tier (Rank 1-10)."""
-    return sample_from_tier(items, 0, SILVER_TIER_END, count)
+    return sample_from_tier(items, 0, SILVER_TIER_END, count, rng)
 
 
-def build_row_id(axes: list[RowAxis]) -> str:
-    """Build a unique row ID from axes and their roles."""
-    parts = ["watchly.theme"]
+ROLE_ID_PREFIXES = {
+    AxisRole.ANCHOR: "a",
+    AxisRole.FLAVOR: "f",
+    AxisRole.FALLBACK: "b",
+}
 
-    role_map = {
-        AxisRole.ANCHOR: "a",
-        AxisRole.FLAVOR: "f",
-        AxisRole.FALLBACK: "b",
-    }
-
-    # Sort axes for consistent IDs
-    sorted_axes = sorted(axes, key=lambda x: (x.role, x.name, str(x.value)))
+AXIS_ID_PREFIXES = {
+    AXIS_GENRE: "g",
+    AXIS_KEYWORD: "k",
+    AXIS_COUNTRY: "ct",
+    AXIS_RUNTIME: "r",
+    AXIS_CREATOR: "cr",
+}
 
-    for axis in sorted_axes:
-        role_pfx = role_map.get(axis.role, "f")
-        axis_pfx = {
-            AXIS_GENRE: "g",
-            AXIS_KEYWORD: "k",
-            AXIS_COUNTRY: "ct",
-            AXIS_RUNTIME: "r",
-            AXIS_CREATOR: "cr",
-        }.get(axis.name, "x")
 
-        # Handle value formatting
-        val = axis.value
-        if isinstance(val, (list, tuple)):
-            val = "-".join(str(v) for v in val)
+def _row_id_part(axis: RowAxis) -> tuple[tuple[str, str, str], str]:
+    """Return (sort key, ID segment) for an axis."""
+    sort_val = str(axis.value)
+    val_str = "-".join(map(str, axis.value)) if isinstance(axis.value, (list, tuple)) else sort_val
+    segment = f"{ROLE_ID_PREFIXES.get(axis.role, 'f')}:{AXIS_ID_PREFIXES.get(axis.name, 'x')}{val_str}"
+    return (axis.role, axis.name, sort_val), segment
 
-        parts.append(f"{role_pfx}:{axis_pfx}{val}")
 
-    return ".".join(parts)
+def build_row_id(axes: list[RowAxis]) -> str:
+    """Build a unique row ID from axes and their roles."""
+    # Sort axes for consistent IDs
+    parts = sorted(map(_row_id_part, axes))
+    return ".".join(["watchly.theme", *(segment for _, segment in parts)])
 
 
 class RowDefinition(BaseModel):
@@ -152,15 +176,18 @@ class LLMRowTheme(BaseModel):
     country: str | None = Field(default=None, description="ISO 3166-1 country code or null")
 
 
-class RowComponents(BaseModel):
+@dataclass(slots=True)
+class RowComponents:
     """Internal structure for building a row."""
 
-    axes: list[RowAxis] = []
+    axes: list[RowAxis] = field(default_factory=list)
     explanation: str | None = None
 
     # For title generation
-    prompt_parts: list[str] = []
-    fallback_parts: list[str] = []
+    prompt_parts: list[str] = field(default_factory=list)
+    fallback_parts: list[str] = field(default_factory=list)
+    # Country adjectives lead the fallback title; kept apart so they can be appended, not inserted at 0
+    fallback_prefixes: list[str] = field(default_factory=list)
 
     def build_prompt(self) -> str:
         """Build Gemini prompt from parts."""
@@ -168,7 +195,7 @@ class RowComponents(BaseModel):
 
     def build_fallback(self) -> str:
         """Build fallback title from parts."""
-        return " ".join(self.fallback_parts)
+        return " ".join([*reversed(self.fallback_prefixes), *self.fallback_parts])
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dict for row building."""
@@ -209,15 +236,19 @@ class ExtractedFeatures:
 class RowBuilder:
     """Builds a single row by sampling from axes with specific roles."""
 
-    def __init__(self, features: ExtractedFeatures):
+    def __init__(self, features: ExtractedFeatures, rng: random.Random = _default_rng):
         self.features = features
+        self.rng = rng
         self.components = RowComponents()
         self.used_axes: set[str] = set()
+        self._anchor_count = 0
 
     def add_axis(self, name: str, value: Any, role: AxisRole, weight: float = 1.0) -> "RowBuilder":
         """Add an axis with a specific role and weight."""
         axis = RowAxis(name=name, value=value, role=role, weight=weight)
         self.components.axes.append(axis)
+        if role == AxisRole.ANCHOR:
+            self._anchor_count += 1
 
         # Build prompt and fallback title parts
         display_val = self._get_display_value(name, value)
@@ -233,7 +264,7 @@ class RowBuilder:
             # For fallback title, we prioritize Anchor and Flavor
             if role in (AxisRole.ANCHOR, AxisRole.FLAVOR):
                 if name == AXIS_COUNTRY:
-                    self.components.fallback_parts.insert(0, display_val)
+                    self.components.fallback_prefixes.append(display_val)
                 else:
                     self.components.fallback_parts.append(display_val)
 
@@ -247,17 +278,14 @@ class RowBuilder:
         if name == AXIS_KEYWORD:
             return normalize_keyword(self.features.get_keyword_name(value) or "")
         if name == AXIS_COUNTRY:
-            return get_country_adjective(value)
+            return get_country_adjective(value, self.rng)
         if name == AXIS_RUNTIME:
             return runtime_to_modifier(value)
         return str(value)
 
     def build(self) -> RowComponents | None:
         """Build and return the row components if valid (has at least one anchor)."""
-        has_anchor = any(a.role == AxisRole.ANCHOR for a in self.components.axes)
-        if has_anchor:
-            return self.components
-        return None
+        return self.components if self._anchor_count else None
 
 
 class RowGeneratorService:
@@ -267,13 +295,19 @@ class RowGeneratorService:
         self.tmdb_service = tmdb_service or get_tmdb_service()
 
     async def generate_rows(
-        self, profile: TasteProfile, content_type: str = "movie", api_key: str | None = None
+        self,
+        profile: TasteProfile,
+        content_type: str = "movie",
+        api_key: str | None = None,
+        seed: str | None = None,
     ) -> list[RowDefinition]:
         """
         Generate exactly 3 personalized catalog rows.
         If api_key is provided, uses LLM to generate creative themes.
         Otherwise uses tiered sampling system.
 
+        seed makes the tiered sampling reproducible (e.g. a daily rotation seed).
+
         Returns:
             List of RowDefinition
         """
@@ -291,29 +325,32 @@ class RowGeneratorService:
                 logger.warning(f"LLM row generation failed, falling back to tiered sampling: {e}")
 
         # 3. Fallback to Tiered Sampling
+        rng = random.Random(f"{seed}:{content_type}") if seed else _default_rng
         rows_data = []
         used_genres = set()
         used_keywords = set()
 
         # Row 1: The Core (Strongest matches)
-        core_row = self._build_core_row(features, exclude_genres=used_genres, exclude_keywords=used_keywords)
+        core_row = self._build_core_row(features, exclude_genres=used_genres, exclude_keywords=used_keywords, rng=rng)
         if core_row:
             rows_data.append(core_row)
             self._update_used_axes(core_row, used_genres, used_keywords)
 
         # Row 2: The Blend (Mixing themes)
-        blend_row = self._build_blend_row(features, exclude_genres=used_genres, exclude_keywords=used_keywords)
+        blend_row = self._build_blend_row(features, exclude_genres=used_genres, exclude_keywords=used_keywords, rng=rng)
         if blend_row:
             rows_data.append(blend_row)
             self._update_used_axes(blend_row, used_genres, used_keywords)
 
         # Row 3: The Rising Star (Exploration)
-        rising_row = self._build_rising_star_row(features, exclude_genres=used_genres, exclude_keywords=used_keywords)
+        rising_row = self._build_rising_star_row(
+            features, exclude_genres=used_genres, exclude_keywords=used_keywords, rng=rng
+        )
         if rising_row:
             rows_data.append(rising_row)
 
         # 4. Generate titles via server's default Gemini model (gemma)
-        final_rows = await self._generate_titles(rows_data[:3])
+        final_rows = await self._generate_titles(rows_data)
 
         logger.info(f"Generated {len(final_rows)} dynamic rows (Tiered Sampling) for {content_type}")
         return final_rows
@@ -332,18 +369,16 @@ class RowGeneratorService:
         genres = profile.get_top_genres(limit=5)
         keywords = profile.get_top_keywords(limit=10)
         countries = profile.get_top_countries(limit=2)
-        runtimes = sorted(profile.runtime_bucket_scores.items(), key=lambda x: x[1], reverse=True)
+        runtimes = profile.get_top_runtimes(limit=2)
         creators = profile.get_top_creators(limit=5)
 
-        # Fetch keyword names in parallel
+        # Resolve keyword names in one batch (cached names need no TMDB round-trip)
         keyword_ids = [k_id for k_id, _ in keywords]
-        keyword_names_raw = await asyncio.gather(
-            *[self._get_keyword_name(kid) for kid in keyword_ids],
-            return_exceptions=True,
-        )
-        keyword_names = {
-            kid: name for kid, name in zip(keyword_ids, keyword_names_raw) if name and not isinstance(name, Exception)
-        }
+        try:
+            keyword_names = await self.tmdb_service.get_keyword_names(keyword_ids)
+        except Exception as e:
+            logger.warning(f"Failed to resolve keyword names: {e}")
+            keyword_names = {}
 
         return ExtractedFeatures(
             genres=genres,
@@ -355,19 +390,12 @@ class RowGeneratorService:
             content_type=content_type,
         )
 
-    async def _get_keyword_name(self, keyword_id: int) -> str | None:
-        """Fetch keyword name from TMDB."""
-        try:
-            data = await self.tmdb_service.get_keyword_details(keyword_id)
-            return data.get("name")
-        except Exception:
-            return None
-
     def _build_core_row(
         self,
         features: ExtractedFeatures,
         exclude_genres: set[int] | None = None,
         exclude_keywords: set[int] | None = None,
+        rng: random.Random = _default_rng,
     ) -> RowComponents | None:
         """
         Build 'The Core' row:
@@ -377,24 +405,28 @@ class RowGeneratorService:
         """
         exclude_genres = exclude_genres or set()
         exclude_keywords = exclude_keywords or set()
-        builder = RowBuilder(features)
+        builder = RowBuilder(features, rng)
 
         # 1. Anchor: Genre
         available_genres = [g for g in features.genres if g[0] not in exclude_genres]
-        genres = sample_from_gold(available_genres, 1) if available_genres else sample_from_gold(features.genres, 1)
+        genres = (
+            sample_from_gold(available_genres, 1, rng)
+            if available_genres
+            else sample_from_gold(features.genres, 1, rng)
+        )
         if not genres:
             return None
         builder.add_axis(AXIS_GENRE, genres[0][0], AxisRole.ANCHOR, 1.0)
 
         # 2. Flavor: 1-2 Keywords
         available_keywords = [k for k in features.keywords if k[0] not in exclude_keywords]
-        keywords = sample_from_gold(available_keywords, random.randint(1, 2)) if available_keywords else []
+        keywords = sample_from_gold(available_keywords, rng.randint(1, 2), rng) if available_keywords else []
         for k_id, _ in keywords:
             builder.add_axis(AXIS_KEYWORD, k_id, AxisRole.FLAVOR, 0.7)
 
         # 3. Fallback: Runtime
         if features.runtimes:
-            runtime = random.choice(features.runtimes[:2])
+            runtime = rng.choice(features.runtimes[:2])
             builder.add_axis(AXIS_RUNTIME, runtime[0], AxisRole.FALLBACK, 0.3)
 
         row = builder.build()
@@ -407,6 +439,7 @@ class RowGeneratorService:
         features: ExtractedFeatures,
         exclude_genres: set[int] | None = None,
         exclude_keywords: set[int] | None = None,
+        rng: random.Random = _default_rng,
     ) -> RowComponents | None:
         """
         Build 'The Blend' row:
@@ -414,25 +447,29 @@ class RowGeneratorService:
         Flavor: COUNTRY or secondary GENRE (Gold/Silver)
         """
         exclude_genres = exclude_genres or set()
-        builder = RowBuilder(features)
+        builder = RowBuilder(features, rng)
 
         # 1. Anchor: Genre
         available_genres = [g for g in features.genres if g[0] not in exclude_genres]
-        genres = sample_from_gold(available_genres, 1) if available_genres else sample_from_gold(features.genres, 1)
+        genres = (
+            sample_from_gold(available_genres, 1, rng)
+            if available_genres
+            else sample_from_gold(features.genres, 1, rng)
+        )
         if not genres:
             return None
         builder.add_axis(AXIS_GENRE, genres[0][0], AxisRole.ANCHOR, 1.0)
 
         # 2. Flavor: Country or Secondary Genre
-        flavor_type = random.choice([AXIS_COUNTRY, AXIS_GENRE])
+        flavor_type = rng.choice(BLEND_FLAVOR_TYPES)
 
         if flavor_type == AXIS_COUNTRY and features.countries:
-            country = sample_from_gold_silver(features.countries, 1)
+            country = sample_from_gold_silver(features.countries, 1, rng)
             builder.add_axis(AXIS_COUNTRY, country[0][0], AxisRole.FLAVOR, 0.7)
         elif flavor_type == AXIS_GENRE:
             other_genres = [g for g in features.genres if g[0] != genres[0][0]]
             if other_genres:
-                sec_genre = sample_from_gold_silver(other_genres, 1)
+                sec_genre = sample_from_gold_silver(other_genres, 1, rng)
                 builder.add_axis(AXIS_GENRE, sec_genre[0][0], AxisRole.FLAVOR, 0.7)
 
         row = builder.build()
@@ -445,6 +482,7 @@ class RowGeneratorService:
         features: ExtractedFeatures,
         exclude_genres: set[int] | None = None,
         exclude_keywords: set[int] | None = None,
+        rng: random.Random = _default_rng,
     ) -> RowComponents | None:
         """
         Build 'The Rising Star' row:
@@ -454,11 +492,11 @@ class RowGeneratorService:
         """
         exclude_genres = exclude_genres or set()
         exclude_keywords = exclude_keywords or set()
-        builder = RowBuilder(features)
+        builder = RowBuilder(features, rng)
 
         # 1. Anchor: Recent Keyword (Sampling from Silver to promote exploration)
         available_keywords = [k for k in features.keywords if k[0] not in exclude_keywords]
-        keywords = sample_from_silver(available_keywords, 1) if available_keywords else []
+        keywords = sample_from_silver(available_keywords, 1, rng) if available_keywords else []
         if keywords:
             builder.add_axis(AXIS_KEYWORD, keywords[0][0], AxisRole.ANCHOR, 1.0)
 
@@ -468,13 +506,13 @@ class RowGeneratorService:
 
         # 2. Flavor: Genre (Silver)
         available_genres = [g for g in features.genres if g[0] not in exclude_genres]
-        genres = sample_from_silver(available_genres, 1) if available_genres else []
+        genres = sample_from_silver(available_genres, 1, rng) if available_genres else []
         if genres:
             builder.add_axis(AXIS_GENRE, genres[0][0], AxisRole.FLAVOR, 0.7)
 
         # 3. Fallback: Country
         if features.countries:
-            country = sample_from_gold_silver(features.countries, 1)
+            country = sample_from_gold_silver(features.countries, 1, rng)
             builder.add_axis(AXIS_COUNTRY, country[0][0], AxisRole.FALLBACK, 0.3)
 
         row = builder.build()
@@ -508,34 +546,49 @@ class RowGeneratorService:
 
         return signature_rows
 
+    @staticmethod
+    def _try_local_title(row: RowComponents) -> str | None:
+        """
+        Title simple rows from the template instead of Gemini.
+
+        A country + genre pair reads fine as the fallback title ("Korean Thriller");
+        keyword and multi-genre rows still go to Gemini.
+        """
+        titled_axes = sorted(axis.name for axis in row.axes if axis.role != AxisRole.FALLBACK)
+        if tuple(titled_axes) not in LOCAL_TITLE_SHAPES:
+            return None
+        # Every titled axis must have produced a display value (e.g. a known country adjective)
+        if len(row.fallback_prefixes) + len(row.fallback_parts) != len(titled_axes):
+            return None
+        return row.build_fallback()
+
     async def _generate_titles(self, rows_data: list[RowComponents]) -> list[RowDefinition]:
         """Generate titles for tiered sampling rows via server's default Gemini model."""
         if not rows_data:
             return []
 
-        # Build prompts and fire Gemini requests (uses server key + default model)
-        prompts = [row.build_prompt() for row in rows_data]
-        gemini_tasks = [gemini_service.generate_content_async(p) for p in prompts]
-        results = await asyncio.gather(*gemini_tasks, return_exceptions=True)
+        # Template titles where they fit; everything else goes to Gemini in one batched request
+        titles = [self._try_local_title(row) for row in rows_data]
+        pending = [i for i, title in enumerate(titles) if title is None]
+        if pending:
+            try:
+                generated = await gemini_service.generate_titles_async([rows_data[i].build_prompt() for i in pending])
+            except Exception as e:
+                logger.warning(f"Gemini failed for row titles: {e}")
+                generated = [""] * len(pending)
+            for i, title in zip(pending, generated):
+                titles[i] = title
 
         final_rows = []
-        for i, row in enumerate(rows_data):
-            result = results[i]
-
-            # Determine title
-            if isinstance(result, Exception):
-                logger.warning(f"Gemini failed for row {i}: {result}")
-                title = row.build_fallback()
-            elif result:
-                title = result.strip()
-            else:
-                title = row.build_fallback()
+        for row, title in zip(rows_data, titles):
+            title = title.strip() if title else row.build_fallback()
 
             # Build the row ID
             row_id = build_row_id(row.axes)
 
+            # Every field here is built internally, so skip pydantic validation
             final_rows.append(
-                RowDefinition(
+                RowDefinition.model_construct(
                     title=title,
                     id=row_id,
                     **row.to_dict(),
@@ -7,6 +7,13 @@ from loguru import logger
 from app.services.stremio.client import StremioClient, StremioLikesClient
 
 
+def _recency_key(item: dict[str, Any]) -> tuple[str, Any]:
+    """Sort key for library items: lastWatched, falling back to _mtime (missing values sort last)."""
+    mtime = item.get("_mtime") or ""
+    last_watched = (item.get("state") or {}).get("lastWatched")
+    return str(last_watched or mtime), mtime
+
+
 class StremioLibraryService:
     """
     Handles fetching and processing of user's Stremio library and likes.
@@ -165,19 +172,12 @@ class StremioLibraryService:
                 #     # removed.append(item)
                 #     continue
 
-            # 4. Sort watched items by recency
-            def sort_by_recency(x: dict):
-                state = x.get("state", {}) or {}
-                return (
-                    str(state.get("lastWatched") or str(x.get("_mtime") or "")),
-                    x.get("_mtime") or "",
-                )
-
-            watched.sort(key=sort_by_recency, reverse=True)
-            loved.sort(key=sort_by_recency, reverse=True)
-            liked.sort(key=sort_by_recency, reverse=True)
-            added.sort(key=sort_by_recency, reverse=True)
-            removed.sort(key=sort_by_recency, reverse=True)
+            # 4. Sort watched items by recency (sort() computes each key once per item)
+            watched.sort(key=_recency_key, reverse=True)
+            loved.sort(key=_recency_key, reverse=True)
+            liked.sort(key=_recency_key, reverse=True)
+            added.sort(key=_recency_key, reverse=True)
+            removed.sort(key=_recency_key, reverse=True)
 
             logger.info(
                 f"Found {len(all_raw_items)} library items. Processed {len(watched)} watched items,"
@@ -1,14 +1,109 @@
+import asyncio
 import functools
+import json
+import time
+from itertools import islice
 from typing import Any
 
+import httpx
 from async_lru import alru_cache
 from loguru import logger
 
+from app.core.constants import (
+    TMDB_DETAILS_AIRING_TTL,
+    TMDB_DETAILS_KEY,
+    TMDB_DETAILS_MISS_TTL,
+    TMDB_DETAILS_TTL,
+    TMDB_KEYWORD_NAME_KEY,
+    TMDB_KEYWORD_NAME_TTL,
+)
+from app.services.redis_service import redis_service
 from app.services.tmdb.client import TMDBClient
 
 # from app.services.profile.constants import TOP_PICKS_MIN_VOTE_COUNT, TOP_PICKS_MIN_RATING
 
 
+def _image_url(base: str, path: str | None) -> str:
+    """Join a TMDB image base URL and file path ("" when there is no path)."""
+    if not path:
+        return ""
+    return base + (path if path.startswith("/") else "/" + path)
+
+
+# Process-wide keyword ID -> name memo in front of Redis (names are language independent)
+_KEYWORD_NAME_MEMO_SIZE = 4096
+_keyword_name_memo: dict[int, str] = {}
+
+
+def _remember_keyword_names(names: dict[int, str]) -> None:
+    """Add names to the memo, dropping the oldest entries once it is full."""
+    _keyword_name_memo.update(names)
+    overflow = len(_keyword_name_memo) - _KEYWORD_NAME_MEMO_SIZE
+    if overflow > 0:
+        for kid in list(islice(_keyword_name_memo, overflow)):
+            del _keyword_name_memo[kid]
+
+
+# Top-level details fields read by the recommenders and the profile builder; everything else is dropped
+_DETAILS_FIELDS = (
+    "id",
+    "title",
+    "name",
+    "overview",
+    "release_date",
+    "first_air_date",
+    "poster_path",
+    "backdrop_path",
+    "vote_average",
+    "vote_count",
+    "popularity",
+    "original_language",
+    "runtime",
+    "episode_run_time",
+    "in_production",
+)
+_DETAILS_CAST_LIMIT = 10
+_DETAILS_CREW_JOBS = {"director", "creator", "producer"}
+
+
+def _trim_details(details: dict[str, Any]) -> dict[str, Any]:
+    """Project a details payload (with credits, external_ids and keywords) down to the fields we read."""
+    trimmed = {field: details[field] for field in _DETAILS_FIELDS if field in details}
+    trimmed["genres"] = [{"id": g.get("id"), "name": g.get("name")} for g in details.get("genres") or []]
+    trimmed["production_countries"] = [
+        {"iso_3166_1": c.get("iso_3166_1")} for c in details.get("production_countries") or []
+    ]
+    trimmed["created_by"] = [{"id": c.get("id")} for c in details.get("created_by") or []]
+    trimmed["external_ids"] = {"imdb_id": (details.get("external_ids") or {}).get("imdb_id")}
+
+    collection = details.get("belongs_to_collection")
+    if isinstance(collection, dict):
+        trimmed["belongs_to_collection"] = {"id": collection.get("id")}
+
+    # Movies list keywords under "keywords", series under "results"
+    keywords = details.get("keywords") or {}
+    trimmed["keywords"] = {
+        key: [{"id": k.get("id"), "name": k.get("name")} for k in keywords[key]]
+        for key in ("keywords", "results")
+        if key in keywords
+    }
+
+    credits = details.get("credits") or {}
+    trimmed["credits"] = {
+        "cast": [{"id": c.get("id")} for c in (credits.get("cast") or [])[:_DETAILS_CAST_LIMIT]],
+        "crew": [
+            {"id": c.get("id"), "job": c.get("job")}
+            for c in credits.get("crew") or []
+            if (c.get("job") or "").lower() in _DETAILS_CREW_JOBS
+        ],
+    }
+    return trimmed
+
+
+class _DetailsNotFound(Exception):
+    """Raised inside the in-process details cache so 404s are not kept there for the full TTL."""
+
+
 class TMDBService:
     """
     Service for interacting with The Movie Database (TMDB) API.
@@ -17,6 +112,8 @@ class TMDBService:
 
     def __init__(self, api_key: str, language: str = "en-US"):
         self.client = TMDBClient(api_key=api_key, language=language)
+        # Background stale-while-revalidate refreshes, keyed by cache key (also keeps the tasks referenced)
+        self._details_refreshes: dict[str, asyncio.Task] = {}
 
     async def close(self):
         """Close the underlying HTTP client."""
@@ -51,17 +148,112 @@ class TMDBService:
             logger.exception(f"Error finding TMDB ID for IMDB {imdb_id}: {e}")
             return None, None
 
-    @alru_cache(maxsize=500, ttl=86400)
     async def get_movie_details(self, movie_id: int) -> dict[str, Any]:
-        """Get details of a specific movie with credits and keywords."""
-        params = {"append_to_response": "credits,external_ids,keywords"}
-        return await self.client.get(f"/movie/{movie_id}", params=params)
+        """Get details of a specific movie with credits and keywords.
+
+        Missing IDs return an empty dict; the miss is cached in Redis for TMDB_DETAILS_MISS_TTL.
+        """
+        try:
+            return await self._get_details("movie", movie_id)
+        except _DetailsNotFound:
+            return {}
 
-    @alru_cache(maxsize=500, ttl=86400)
     async def get_tv_details(self, tv_id: int) -> dict[str, Any]:
-        """Get details of a specific TV series with credits and keywords."""
+        """Get details of a specific TV series with credits and keywords.
+
+        Missing IDs return an empty dict; the miss is cached in Redis for TMDB_DETAILS_MISS_TTL.
+        """
+        try:
+            return await self._get_details("tv", tv_id)
+        except _DetailsNotFound:
+            return {}
+
+    # Kept below half the shortest Redis TTL so stale-while-revalidate refreshes actually reach this layer
+    @alru_cache(maxsize=500, ttl=TMDB_DETAILS_AIRING_TTL // 2)
+    async def _get_details(self, media_type: str, tmdb_id: int) -> dict[str, Any]:
+        """
+        Get details through the Redis cache shared by all workers.
+
+        Cached payloads are returned immediately; once older than half their TTL, a background
+        refresh is scheduled (stale-while-revalidate). Misses raise _DetailsNotFound, which
+        alru_cache does not store, so they only live as long as their short Redis entry.
+        """
+        key = self._details_key(media_type, tmdb_id)
+        details = self._read_cached_details(media_type, tmdb_id, key, await redis_service.get(key))
+        if details is None:
+            details = await self._fetch_details(media_type, tmdb_id, key)
+        if not details:
+            raise _DetailsNotFound(f"{media_type}/{tmdb_id}")
+        return details
+
+    async def get_cached_details_many(self, media_type: str, tmdb_ids: list[int]) -> dict[int, dict[str, Any]]:
+        """
+        Read details for many IDs from the Redis cache in a single round-trip.
+
+        Returns:
+            Mapping of TMDB ID to details for cache hits only; misses are left to get_*_details.
+        """
+        if not tmdb_ids:
+            return {}
+        keys = [self._details_key(media_type, tmdb_id) for tmdb_id in tmdb_ids]
+        found = {}
+        for tmdb_id, key, cached in zip(tmdb_ids, keys, await redis_service.mget(keys)):
+            details = self._read_cached_details(media_type, tmdb_id, key, cached)
+            if details is not None:
+                found[tmdb_id] = details
+        return found
+
+    def _details_key(self, media_type: str, tmdb_id: int) -> str:
+        return TMDB_DETAILS_KEY.format(media_type=media_type, tmdb_id=tmdb_id, language=self.client.language)
+
+    def _read_cached_details(
+        self, media_type: str, tmdb_id: int, key: str, cached: str | None
+    ) -> dict[str, Any] | None:
+        """Decode a cached details payload, scheduling a refresh if it's past half its TTL (misses just expire)."""
+        if not cached:
+            return None
+        try:
+            data = json.loads(cached)
+            if data["data"] and time.time() - data["created_at"] > data["ttl"] // 2:
+                self._schedule_details_refresh(media_type, tmdb_id, key)
+            return data["data"]
+        except (json.JSONDecodeError, KeyError, TypeError) as e:
+            logger.warning(f"Failed to decode cached TMDB details for {key}: {e}")
+            return None
+
+    async def _fetch_details(self, media_type: str, tmdb_id: int, key: str) -> dict[str, Any]:
+        """Fetch details from TMDB and store a trimmed copy in Redis."""
         params = {"append_to_response": "credits,external_ids,keywords"}
-        return await self.client.get(f"/tv/{tv_id}", params=params)
+        try:
+            details = await self.client.get(f"/{media_type}/{tmdb_id}", params=params)
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code != 404:
+                raise
+            details = {}
+
+        if details:
+            details = _trim_details(details)
+            ttl = TMDB_DETAILS_AIRING_TTL if details.get("in_production") else TMDB_DETAILS_TTL
+        else:
+            ttl = TMDB_DETAILS_MISS_TTL
+        payload = {"data": details, "created_at": int(time.time()), "ttl": ttl}
+        await redis_service.set(key, json.dumps(payload), ttl)
+        return details
+
+    def _schedule_details_refresh(self, media_type: str, tmdb_id: int, key: str) -> None:
+        """Refresh a stale cache entry in the background (at most one refresh per key)."""
+        if key in self._details_refreshes:
+            return
+
+        async def _refresh() -> None:
+            try:
+                await self._fetch_details(media_type, tmdb_id, key)
+            except Exception as e:
+                logger.debug(f"Background refresh failed for {key}: {e}")
+            finally:
+                self._details_refreshes.pop(key, None)
+
+        self._details_refreshes[key] = asyncio.create_task(_refresh())
 
     @alru_cache(maxsize=500, ttl=86400)
     async def get_recommendations(self, tmdb_id: int, media_type: str, page: int = 1) -> dict[str, Any]:
@@ -99,6 +291,42 @@ class TMDBService:
         """Get details of a specific keyword."""
         return await self.client.get(f"/keyword/{keyword_id}")
 
+    async def get_keyword_names(self, keyword_ids: list[int]) -> dict[int, str]:
+        """
+        Resolve keyword IDs to names.
+
+        TMDB has no bulk keyword endpoint, so names are kept in Redis: one MGET covers every
+        ID, and only misses are fetched (concurrently) from TMDB and written back. Names this
+        process has already seen skip Redis entirely.
+        """
+        names = {kid: _keyword_name_memo[kid] for kid in keyword_ids if kid in _keyword_name_memo}
+        pending = [kid for kid in keyword_ids if kid not in names]
+        if not pending:
+            return names
+
+        keys = [TMDB_KEYWORD_NAME_KEY.format(keyword_id=kid) for kid in pending]
+        cached = {kid: name for kid, name in zip(pending, await redis_service.mget(keys)) if name}
+        _remember_keyword_names(cached)
+        names.update(cached)
+
+        missing = [kid for kid in pending if kid not in cached]
+        if missing:
+            results = await asyncio.gather(*(self.get_keyword_details(kid) for kid in missing), return_exceptions=True)
+            fetched = {
+                kid: data["name"]
+                for kid, data in zip(missing, results)
+                if not isinstance(data, Exception) and data and data.get("name")
+            }
+            await asyncio.gather(
+                *(
+                    redis_service.set(TMDB_KEYWORD_NAME_KEY.format(keyword_id=kid), name, TMDB_KEYWORD_NAME_TTL)
+                    for kid, name in fetched.items()
+                )
+            )
+            _remember_keyword_names(fetched)
+            names.update(fetched)
+        return names
+
     @alru_cache(maxsize=500, ttl=86400)
     async def search_keywords(self, query: str, page: int = 1) -> dict[str, Any]:
         """Search keywords by name. Returns { results: [ { id, name } ], ... }."""
@@ -111,12 +339,14 @@ class TMDBService:
         """Get details of a specific person (actor/director)."""
         return await self.client.get(f"/person/{person_id}")
 
+    @alru_cache(maxsize=100, ttl=900)
     async def get_trending(self, media_type: str, time_window: str = "week", page: int = 1) -> dict[str, Any]:
         """Get trending content."""
         mt = "movie" if media_type == "movie" else "tv"
         params = {"page": page}
         return await self.client.get(f"/trending/{mt}/{time_window}", params=params)
 
+    @alru_cache(maxsize=100, ttl=900)
     async def get_top_rated(self, media_type: str, page: int = 1) -> dict[str, Any]:
         """Get top-rated content list."""
         mt = "movie" if media_type == "movie" else "tv"
@@ -259,11 +489,6 @@ class TMDBService:
         base_poster_logo = "https://image.tmdb.org/t/p/w500"
         base_backdrop = "https://image.tmdb.org/t/p/w780"
 
-        def to_url(base: str, path: str | None) -> str:
-            if not path:
-                return ""
-            return base + (path if path.startswith("/") else "/" + path)
-
         posters = data.get("posters") or []
         logos = data.get("logos") or []
         backdrops = data.get("backdrops") or []
@@ -275,11 +500,11 @@ class TMDBService:
 
         result: dict[str, str] = {}
         if poster_path:
-            result["poster"] = to_url(base_poster_logo, poster_path)
+            result["poster"] = _image_url(base_poster_logo, poster_path)
         if logo_path:
-            result["logo"] = to_url(base_poster_logo, logo_path)
+            result["logo"] = _image_url(base_poster_logo, logo_path)
         if backdrop_path:
-            result["background"] = to_url(base_backdrop, backdrop_path)
+            result["background"] = _image_url(base_backdrop, backdrop_path)
         return result
 
 
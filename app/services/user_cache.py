@@ -1,3 +1,4 @@
+import asyncio
 import hashlib
 import json
 import time
@@ -218,8 +219,11 @@ class UserCacheService:
             Tuple of (profile, watched_tmdb, watched_imdb), or None if either is not cached.
             Returns None if either profile or watched sets are missing.
         """
-        profile = await self.get_profile(token, content_type)
-        watched_sets = await self.get_watched_sets(token, content_type)
+        # Independent keys, so read them concurrently
+        profile, watched_sets = await asyncio.gather(
+            self.get_profile(token, content_type),
+            self.get_watched_sets(token, content_type),
+        )
 
         if profile is None or watched_sets is None:
             return None